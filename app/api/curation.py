@@ -34,6 +34,20 @@ class SubmissionResponse(BaseModel):
 class CuratorAction(BaseModel):
     note: Optional[str] = None
 
+class CuratorActionResponse(BaseModel):
+    status: str
+    message: Optional[str] = None
+
+class BatchCuratorAction(BaseModel):
+    ids: List[int] = Field(..., min_length=1)
+    note: Optional[str] = None
+
+class BatchCuratorActionResponse(BaseModel):
+    status: str
+    approved: List[int]
+    skipped: List[int]
+    message: str
+
 # --- Helpers ---
 
 def get_store() -> KnowledgeStore:
@@ -115,7 +129,7 @@ async def list_submissions(
     submissions = store.get_submissions(status=status)
     return [SubmissionResponse(**s) for s in submissions]
 
-@router.post("/submissions/{id}/approve")
+@router.post("/submissions/{id}/approve", response_model=CuratorActionResponse)
 async def approve_submission(
     id: int,
     action: CuratorAction,
@@ -132,15 +146,50 @@ async def approve_submission(
     if submission["status"] != "pending":
         raise HTTPException(status_code=400, detail=f"Submission is already {submission['status']}")
     
-    # Update status
-    store.update_submission_status(id, "approved", user.id, action.note)
+    # Update status only if still pending; a concurrent approval may have won
+    if not store.update_submissions_status([id], "approved", user.id, action.note):
+        current = store.get_submission_by_id(id)
+        raise HTTPException(status_code=400, detail=f"Submission is already {current['status']}")
     
     # Trigger Ingestion
     background_tasks.add_task(process_ingestion, submission)
     
     return {"status": "approved", "message": "Submission approved and ingestion queued"}
 
-@router.post("/submissions/{id}/reject")
+@router.post("/submissions/approve_batch", response_model=BatchCuratorActionResponse)
+async def approve_submissions_batch(
+    action: BatchCuratorAction,
+    background_tasks: BackgroundTasks,
+    user: User = Depends(require_curator),
+    store: KnowledgeStore = Depends(get_store)
+):
+    """Approve many submissions at once and trigger their ingestion.
+    
+    Unknown or already processed submissions are skipped.
+    """
+    
+    submissions = store.get_submissions_by_ids(action.ids)
+    
+    # One guarded transaction; only rows still pending are approved here
+    approved_ids = store.update_submissions_status(
+        [i for i, s in submissions.items() if s["status"] == "pending"],
+        "approved", user.id, action.note
+    )
+    approved_set = set(approved_ids)
+    skipped_ids = [i for i in dict.fromkeys(action.ids) if i not in approved_set]
+    
+    # Trigger Ingestion
+    if approved_ids:
+        background_tasks.add_task(process_ingestion_batch, [submissions[i] for i in approved_ids])
+    
+    return {
+        "status": "approved",
+        "approved": approved_ids,
+        "skipped": skipped_ids,
+        "message": f"{len(approved_ids)} submissions approved and ingestion queued"
+    }
+
+@router.post("/submissions/{id}/reject", response_model=CuratorActionResponse, response_model_exclude_unset=True)
 async def reject_submission(
     id: int,
     action: CuratorAction,
@@ -212,3 +261,8 @@ def process_ingestion(submission: dict):
             
     except Exception as e:
         print(f"[Ingest] Failed to process submission {submission['id']}: {e}")
+
+def process_ingestion_batch(submissions: List[dict]):
+    """Background task to ingest a batch of approved submissions."""
+    for submission in submissions:
+        process_ingestion(submission)
@@ -1,15 +1,20 @@
 """API routes for Cultural AI RAG system."""
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional
+import logging
 import tempfile
 import os
 
 from app.core.rag_chain import get_rag_chain, get_analysis_chain, get_linguistic_chain
 from app.core.vectorstore import get_collection_stats, similarity_search
+from app.core.metadata import strip_embedding_prefix
 from app.ingestion.pipeline import get_pipeline
 
+logger = logging.getLogger(__name__)
+
 
 router = APIRouter(prefix="/api", tags=["Cultural AI"])
 
@@ -96,6 +101,29 @@ async def chat(request: ChatRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Same as /chat, but streams the answer text while it is being generated.
+    """
+    try:
+        chain = get_rag_chain(k=request.k, temperature=request.temperature)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    async def stream():
+        # The 200 status is already sent once streaming starts, so failures
+        # during retrieval or generation are reported in the body
+        try:
+            async for chunk in chain.astream(request.question):
+                yield chunk
+        except Exception as e:
+            logger.exception("Chat stream failed")
+            yield f"\n[ERROR] {e}"
+    
+    return StreamingResponse(stream(), media_type="text/plain")
+
+
 @router.post("/analyze", response_model=AnalysisResponse)
 async def analyze(request: AnalysisRequest):
     """
@@ -300,8 +328,9 @@ async def search(request: SearchRequest):
         docs = similarity_search(request.query, k=request.k)
         results = []
         for doc in docs:
+            content = strip_embedding_prefix(doc.page_content, doc.metadata)
             results.append({
-                "content": doc.page_content[:500] + "..." if len(doc.page_content) > 500 else doc.page_content,
+                "content": content[:500] + "..." if len(content) > 500 else content,
                 "metadata": doc.metadata
             })
         return {"results": results, "count": len(results)}
@@ -484,10 +513,11 @@ async def cultural_search(request: CulturalSearchRequest):
             limit=request.k
         )
         
-        # Retrieve documents by vector IDs
+        # Retrieve metadata of all hits at once
+        docs_meta = knowledge_store.get_documents_metadata_batch(vector_ids)
         results = []
         for vector_id in vector_ids:
-            doc_meta = knowledge_store.get_document_by_vector_id(vector_id)
+            doc_meta = docs_meta.get(vector_id)
             if doc_meta:
                 results.append({
                     "vector_id": vector_id,
@@ -15,6 +15,13 @@ class Settings(BaseSettings):
     # ChromaDB settings
     CHROMA_PERSIST_DIR: str = "./data/chroma"
     COLLECTION_NAME: str = "cultural_knowledge"
+    CHROMA_BATCH_SIZE: int = 200  # Chunks per add_documents call during ingestion
+    
+    # HNSW index parameters (only applied when a collection is created)
+    CHROMA_HNSW_SPACE: str = "l2"  # l2, ip or cosine
+    CHROMA_HNSW_M: int = 16  # Graph degree; lower uses less memory
+    CHROMA_HNSW_CONSTRUCTION_EF: int = 100
+    CHROMA_HNSW_SEARCH_EF: int = 10
     
     # Knowledge Store settings (Cultural Nodes)
     KNOWLEDGE_STORE_PATH: str = "./data/cultural_knowledge.db"
@@ -23,9 +30,14 @@ class Settings(BaseSettings):
     CHUNK_SIZE: int = 1000
     CHUNK_OVERLAP: int = 200
     USE_DISCOURSE_CHUNKING: bool = True  # Enable discourse-aware chunking
+    DISCOURSE_PARALLEL_MIN_DOCS: int = 0  # Chunk in worker processes from this many docs; 0 = never
+    INGEST_PROCESSES: int = 0  # Worker processes preparing files; 0 or 1 = in-process
+    EMBED_METADATA_PREFIX: bool = True  # Prepend [title|source_type] to chunk text before embedding
     
     # Embedding versioning
     EMBEDDING_VERSION: str = ""  # Auto-generated if empty
+    EMBEDDING_CACHE_ENABLED: bool = True  # Reuse vectors of unchanged chunks on re-ingest
+    EMBEDDING_CACHE_PATH: str = "./data/embedding_cache.db"
     
     # API settings
     API_HOST: str = "0.0.0.0"
@@ -34,6 +46,12 @@ class Settings(BaseSettings):
     # Retrieval settings
     RETRIEVAL_K: int = 4  # Number of documents to retrieve
     
+    # Semantic answer cache (separate Chroma collection)
+    QA_CACHE_ENABLED: bool = True
+    QA_CACHE_COLLECTION_NAME: str = "qa_cache"
+    QA_CACHE_MAX_DISTANCE: float = 0.1  # Cosine distance for a cache hit
+    QA_CACHE_TTL_SECONDS: int = 86400  # Cached answers expire after a day
+    
     # Curatorial policy
     CURATORIAL_POLICY: str = "cultural"  # Default policy
     
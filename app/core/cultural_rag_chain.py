@@ -7,10 +7,12 @@ that respect knowledge provenance and provide non-hegemonic perspectives.
 from typing import List, Dict, Any, Optional
 from langchain_core.documents import Document
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import RunnableLambda
 
 from app.core.llm import get_llm
+from app.core.metadata import strip_embedding_prefix
 from app.core.cultural_retriever import get_cultural_retriever, RetrievalStrategy
-from app.prompts.templates import get_qa_prompt
+from app.prompts.templates import render_qa
 from app.core.rag_chain import format_docs, extract_sources
 
 
@@ -41,7 +43,8 @@ def format_docs_with_metadata(docs: List[Document]) -> str:
         header = f"[Sumber {i}: {source}]"
         prov_info = f"[Tipe: {source_type} | Otoritas: {authority} | Posisi: {position}]"
         
-        formatted.append(f"{header}\n{prov_info}\n{doc.page_content}")
+        content = strip_embedding_prefix(doc.page_content, meta)
+        formatted.append(f"{header}\n{prov_info}\n{content}")
     
     return "\n\n---\n\n".join(formatted)
 
@@ -94,7 +97,7 @@ class CulturalRAGChain:
         """
         self.retriever = get_cultural_retriever()
         self.llm = get_llm(temperature=temperature)
-        self.prompt = get_qa_prompt()
+        self._chain = RunnableLambda(render_qa) | self.llm | StrOutputParser()
         self.k = k
         self.boost_community = boost_community
     
@@ -131,8 +134,7 @@ class CulturalRAGChain:
         context = format_docs_with_metadata(docs)
         
         # Generate answer
-        chain = self.prompt | self.llm | StrOutputParser()
-        answer = chain.invoke({
+        answer = self._chain.invoke({
             "context": context,
             "question": question
         })
@@ -175,13 +177,13 @@ class CulturalRAGChain:
             if docs:
                 perspectives_text.append(f"\n[Perspektif {source_type.upper()}]")
                 for doc in docs:
-                    perspectives_text.append(doc.page_content[:200] + "...")
+                    content = strip_embedding_prefix(doc.page_content, doc.metadata)
+                    perspectives_text.append(content[:200] + "...")
         
         full_context = primary_context + "\n\n" + "\n".join(perspectives_text)
         
         # Generate answer
-        chain = self.prompt | self.llm | StrOutputParser()
-        answer = chain.invoke({
+        answer = self._chain.invoke({
             "context": full_context,
             "question": question
         })
@@ -225,8 +227,7 @@ class CulturalRAGChain:
         
         context = format_docs_with_metadata(docs)
         
-        chain = self.prompt | self.llm | StrOutputParser()
-        answer = chain.invoke({
+        answer = self._chain.invoke({
             "context": context,
             "question": question
         })
@@ -11,6 +11,8 @@ similarity, this retriever can:
 5. Balance different discourse positions
 """
 
+from collections import Counter
+from itertools import chain
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
 from langchain_core.documents import Document
@@ -41,6 +43,9 @@ class CulturalRetriever:
         "archival": 1.1,
     }
     
+    # Source types covered by plural retrieval
+    PLURAL_SOURCE_TYPES = ["community", "academic", "media", "archival"]
+    
     def __init__(self):
         """Initialize cultural retriever."""
         self.vectorstore = get_vectorstore()
@@ -87,7 +92,30 @@ class CulturalRetriever:
         # Get candidate documents from vector store
         candidates_with_scores = similarity_search_with_score(query, k=k*3)
         
-        # Filter by metadata
+        return self._filter_epistemic(
+            candidates_with_scores, epistemic_origin, source_type, authority_level, k
+        )
+    
+    def _filter_epistemic(
+        self,
+        candidates_with_scores: List[Tuple[Document, float]],
+        epistemic_origin: Optional[str],
+        source_type: Optional[str],
+        authority_level: Optional[str],
+        k: int
+    ) -> List[Document]:
+        """Keep the first k candidates matching the epistemic criteria.
+        
+        Args:
+            candidates_with_scores: (document, score) pairs, best first
+            epistemic_origin: Required origin, if any
+            source_type: Required source type, if any
+            authority_level: Required authority level, if any
+            k: Number of documents
+            
+        Returns:
+            Filtered documents
+        """
         filtered_docs = []
         for doc, score in candidates_with_scores:
             metadata = doc.metadata
@@ -124,10 +152,9 @@ class CulturalRetriever:
         Returns:
             Dictionary mapping source types to documents
         """
-        source_types = ["community", "academic", "media", "archival"]
         results = {}
         
-        for source_type in source_types:
+        for source_type in self.PLURAL_SOURCE_TYPES:
             docs = self.retrieve_epistemic(
                 query=query,
                 source_type=source_type,
@@ -157,6 +184,24 @@ class CulturalRetriever:
         # Get candidates
         candidates_with_scores = similarity_search_with_score(query, k=k*2)
         
+        return self._rank_by_authority(candidates_with_scores, boost_community, k)
+    
+    def _rank_by_authority(
+        self,
+        candidates_with_scores: List[Tuple[Document, float]],
+        boost_community: bool,
+        k: int
+    ) -> List[Document]:
+        """Re-rank candidates by authority-weighted score.
+        
+        Args:
+            candidates_with_scores: (document, score) pairs
+            boost_community: Whether to boost community sources
+            k: Number of documents
+            
+        Returns:
+            Ranked documents
+        """
         # Re-rank by authority
         ranked = []
         for doc, sim_score in candidates_with_scores:
@@ -193,6 +238,22 @@ class CulturalRetriever:
         """
         candidates_with_scores = similarity_search_with_score(query, k=k*3)
         
+        return self._balance_discourse(candidates_with_scores, k)
+    
+    def _balance_discourse(
+        self,
+        candidates_with_scores: List[Tuple[Document, float]],
+        k: int
+    ) -> List[Document]:
+        """Select candidates evenly across discourse positions.
+        
+        Args:
+            candidates_with_scores: (document, score) pairs
+            k: Number of documents
+            
+        Returns:
+            Documents with balanced discourse positions
+        """
         # Group by discourse position
         by_position = {
             "critical": [],
@@ -220,6 +281,61 @@ class CulturalRetriever:
         balanced.sort(key=lambda x: x[1], reverse=True)
         return [doc for doc, score in balanced[:k]]
     
+    def retrieve_all_views(
+        self,
+        query: str,
+        k_standard: int = 3,
+        k_epistemic: int = 3,
+        source_type: str = "community",
+        k_per_source: int = 1,
+        k_authority: int = 4,
+        boost_community: bool = True,
+        k_balanced: int = 4
+    ) -> Dict:
+        """Run the standard, epistemic, plural, authority-ranked and
+        discourse-balanced retrievals from a single similarity search.
+        
+        The query is embedded and searched once for the largest candidate
+        pool any view needs; each view then works on the same prefix of
+        that pool its own retrieve_* method would have fetched.
+        
+        Args:
+            query: Search query
+            k_standard: Documents for the standard view
+            k_epistemic: Documents for the epistemic view
+            source_type: Source type required by the epistemic view
+            k_per_source: Documents per source type in the plural view
+            k_authority: Documents for the authority-ranked view
+            boost_community: Whether to boost community sources
+            k_balanced: Documents for the discourse-balanced view
+            
+        Returns:
+            Dictionary with "standard", "epistemic", "plural",
+            "authority_ranked" and "discourse_balanced" results
+        """
+        top_m = max(k_standard, k_epistemic*3, k_per_source*3, k_authority*2, k_balanced*3)
+        candidates = similarity_search_with_score(query, k=top_m)
+        
+        plural = {}
+        for plural_source in self.PLURAL_SOURCE_TYPES:
+            docs = self._filter_epistemic(
+                candidates[:k_per_source*3], None, plural_source, None, k_per_source
+            )
+            if docs:
+                plural[plural_source] = docs
+        
+        return {
+            "standard": [doc for doc, score in candidates[:k_standard]],
+            "epistemic": self._filter_epistemic(
+                candidates[:k_epistemic*3], None, source_type, None, k_epistemic
+            ),
+            "plural": plural,
+            "authority_ranked": self._rank_by_authority(
+                candidates[:k_authority*2], boost_community, k_authority
+            ),
+            "discourse_balanced": self._balance_discourse(candidates[:k_balanced*3], k_balanced),
+        }
+    
     def retrieve_by_theme(
         self,
         query: str,
@@ -358,34 +474,15 @@ class CulturalRetriever:
             for docs in perspectives.values():
                 all_docs.extend(docs)
         
-        # Count sources
-        source_counts = {}
-        authority_counts = {}
-        discourse_counts = {}
-        themes_counts = {}
-        
-        for doc in all_docs:
-            meta = doc.metadata
-            
-            source = meta.get("source_type", "unknown")
-            source_counts[source] = source_counts.get(source, 0) + 1
-            
-            authority = meta.get("authority_level", "unknown")
-            authority_counts[authority] = authority_counts.get(authority, 0) + 1
-            
-            discourse = meta.get("discourse_position", "unknown")
-            discourse_counts[discourse] = discourse_counts.get(discourse, 0) + 1
-            
-            themes = meta.get("themes", [])
-            for theme in themes:
-                themes_counts[theme] = themes_counts.get(theme, 0) + 1
+        # Count sources (Counter keeps first-seen order, like the plain dicts before)
+        metas = [doc.metadata for doc in all_docs]
         
         result["metadata_summary"] = {
             "total_documents": len(all_docs),
-            "by_source": source_counts,
-            "by_authority": authority_counts,
-            "by_discourse": discourse_counts,
-            "themes": themes_counts
+            "by_source": dict(Counter(meta.get("source_type", "unknown") for meta in metas)),
+            "by_authority": dict(Counter(meta.get("authority_level", "unknown") for meta in metas)),
+            "by_discourse": dict(Counter(meta.get("discourse_position", "unknown") for meta in metas)),
+            "themes": dict(Counter(chain.from_iterable(meta.get("themes", []) for meta in metas)))
         }
         
         return result
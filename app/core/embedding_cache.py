@@ -0,0 +1,184 @@
+"""Persistent embedding cache keyed by content hash.
+
+Re-ingesting a file (common while developing or reindexing) would otherwise
+re-embed every chunk. Vectors are stored in SQLite under a 128-bit BLAKE2b
+digest of the embedding model and the chunk text, so unchanged chunks skip
+the model call.
+"""
+
+import hashlib
+import sqlite3
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from app.config import get_settings
+from app.core.embeddings import get_embeddings
+
+
+class EmbeddingCache:
+    """SQLite-backed store of embedding vectors by content hash."""
+    
+    # Stay below SQLite's host parameter limit in IN (...) lookups
+    LOOKUP_BATCH_SIZE = 500
+    
+    def __init__(self, db_path: str = "./data/embedding_cache.db"):
+        """Initialize embedding cache.
+        
+        Args:
+            db_path: Path to SQLite database
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._init_schema()
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get database connection.
+        
+        Returns:
+            SQLite connection
+        """
+        return sqlite3.connect(self.db_path)
+    
+    def _init_schema(self):
+        """Create the cache table."""
+        conn = self._get_connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                hash BLOB PRIMARY KEY,
+                vector BLOB NOT NULL
+            )
+        """)
+        conn.commit()
+        conn.close()
+    
+    def get_many(self, hashes: List[bytes]) -> Dict[bytes, List[float]]:
+        """Look up cached vectors.
+        
+        Args:
+            hashes: Content hashes to look up
+        
+        Returns:
+            Mapping of hash to vector for every hit
+        """
+        conn = self._get_connection()
+        found = {}
+        
+        for i in range(0, len(hashes), self.LOOKUP_BATCH_SIZE):
+            batch = hashes[i:i + self.LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT hash, vector FROM embeddings WHERE hash IN ({placeholders})",
+                batch
+            )
+            for content_hash, vector in rows:
+                found[content_hash] = array("f", vector).tolist()
+        
+        conn.close()
+        return found
+    
+    def put_many(self, items: Dict[bytes, List[float]]):
+        """Store vectors in one transaction.
+        
+        Vectors are kept as float32, the precision Chroma stores them at.
+        
+        Args:
+            items: Mapping of content hash to vector
+        """
+        conn = self._get_connection()
+        conn.executemany(
+            "INSERT OR IGNORE INTO embeddings (hash, vector) VALUES (?, ?)",
+            [(content_hash, array("f", vector).tobytes()) for content_hash, vector in items.items()]
+        )
+        conn.commit()
+        conn.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that only embeds texts missing from the cache."""
+    
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache, namespace: str):
+        """Initialize cached embeddings.
+        
+        Args:
+            embeddings: Underlying embedding model
+            cache: Embedding cache
+            namespace: Model identity mixed into every hash
+        """
+        self.embeddings = embeddings
+        self.cache = cache
+        self.namespace = namespace
+    
+    def _hash(self, text: str) -> bytes:
+        """Hash a text together with the model namespace."""
+        return hashlib.blake2b(f"{self.namespace}\0{text}".encode("utf-8"), digest_size=16).digest()
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, reusing cached vectors.
+        
+        Args:
+            texts: Texts to embed
+        
+        Returns:
+            One vector per text, in order
+        """
+        hashes = [self._hash(text) for text in texts]
+        vectors = self.cache.get_many(hashes)
+        
+        # Embed each distinct missing text once
+        missing = {content_hash: text for content_hash, text in zip(hashes, texts) if content_hash not in vectors}
+        if missing:
+            new_vectors = dict(zip(missing, self.embeddings.embed_documents(list(missing.values()))))
+            self.cache.put_many(new_vectors)
+            vectors.update(new_vectors)
+        
+        return [vectors[content_hash] for content_hash in hashes]
+    
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query; queries are not cached.
+        
+        Args:
+            text: Query text
+        
+        Returns:
+            Query vector
+        """
+        return self.embeddings.embed_query(text)
+
+
+# Global instance
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get or create embedding cache instance.
+    
+    Returns:
+        EmbeddingCache instance
+    """
+    global _embedding_cache
+    
+    if _embedding_cache is None:
+        settings = get_settings()
+        _embedding_cache = EmbeddingCache(db_path=settings.EMBEDDING_CACHE_PATH)
+    
+    return _embedding_cache
+
+
+def get_cached_embeddings() -> Embeddings:
+    """Get document embeddings, backed by the cache when enabled.
+    
+    Returns:
+        CachedEmbeddings, or the plain model if caching is disabled
+    """
+    settings = get_settings()
+    embeddings = get_embeddings()
+    
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return embeddings
+    
+    namespace = f"{settings.EMBEDDING_MODEL}:{settings.EMBEDDING_VERSION}"
+    return CachedEmbeddings(embeddings, get_embedding_cache(), namespace)
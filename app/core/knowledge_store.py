@@ -7,9 +7,9 @@ and cultural context for epistemic filtering and non-hegemonic retrieval.
 
 import sqlite3
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from datetime import datetime
-import json
+import orjson
 
 from app.config import get_settings
 
@@ -17,6 +17,38 @@ from app.config import get_settings
 class KnowledgeStore:
     """SQLite-based knowledge store for metadata and relations."""
     
+    # Stay below SQLite's host parameter limit in IN (...) lookups
+    LOOKUP_BATCH_SIZE = 500
+    
+    # Themes listed in get_stats
+    TOP_THEMES_LIMIT = 50
+    
+    # Secondary indexes maintained on every document insert; a large bulk
+    # insert drops them and rebuilds each one in a single pass afterwards
+    DEFERRABLE_INDEXES = {
+        "idx_vector_id": "documents(vector_id)",
+        "idx_source_type": "documents(source_type)",
+        "idx_authority": "documents(authority_level)",
+        "idx_epistemic": "documents(epistemic_origin)",
+        "idx_language": "documents(language)",
+        "idx_category": "documents(category)",
+        "idx_discourse": "documents(discourse_position)",
+        "idx_document_themes_theme": "document_themes(theme_id)",
+    }
+    
+    # Smallest bulk insert that defers index maintenance
+    BULK_INDEX_THRESHOLD = 100
+    
+    # Applied to every connection; journal_mode=WAL persists in the file
+    # and is set once in _init_schema
+    CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",  # Safe under WAL, one fsync per checkpoint
+        "PRAGMA cache_size=-65536",  # 64 MB page cache
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",  # 256 MB
+        "PRAGMA busy_timeout=60000",  # Wait for writers instead of failing
+    )
+    
     def __init__(self, db_path: str = "./data/cultural_knowledge.db"):
         """Initialize knowledge store.
         
@@ -37,6 +69,8 @@ class KnowledgeStore:
         """
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        for pragma in self.CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
     
     def _init_schema(self):
@@ -44,6 +78,9 @@ class KnowledgeStore:
         conn = self._get_connection()
         cursor = conn.cursor()
         
+        # Readers no longer block on the writer
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Documents table - main document metadata
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS documents (
@@ -63,10 +100,16 @@ class KnowledgeStore:
                 filename TEXT,
                 chunk_index INTEGER,
                 has_citation BOOLEAN DEFAULT 0,
-                created_at TEXT NOT NULL
+                created_at TEXT NOT NULL,
+                category TEXT
             )
         """)
         
+        # Databases created before the category column existed
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(documents)")}
+        if "category" not in columns:
+            cursor.execute("ALTER TABLE documents ADD COLUMN category TEXT")
+        
         # Metadata table - flexible key-value for additional metadata
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS metadata (
@@ -142,17 +185,37 @@ class KnowledgeStore:
             )
         """)
         
+        # Files already ingested from a directory, with their signature
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ingested_files (
+                filepath TEXT PRIMARY KEY,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                ingested_at TEXT NOT NULL,
+                sha TEXT,
+                chunk_count INTEGER
+            )
+        """)
+        
+        # Manifests created before content hashes and chunk counts were recorded
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(ingested_files)")}
+        if "sha" not in columns:
+            cursor.execute("ALTER TABLE ingested_files ADD COLUMN sha TEXT")
+        if "chunk_count" not in columns:
+            cursor.execute("ALTER TABLE ingested_files ADD COLUMN chunk_count INTEGER")
+        
         # Create indices for common queries
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_vector_id ON documents(vector_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_source_type ON documents(source_type)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_authority ON documents(authority_level)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_epistemic ON documents(epistemic_origin)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_language ON documents(language)")
+        self._create_indexes(cursor)
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_submission_status ON submissions(status)")
         
         conn.commit()
         conn.close()
     
+    def _create_indexes(self, cursor: sqlite3.Cursor):
+        """Create the deferrable secondary indexes if missing."""
+        for name, target in self.DEFERRABLE_INDEXES.items():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+    
     def add_document(
         self,
         vector_id: str,
@@ -170,6 +233,120 @@ class KnowledgeStore:
         conn = self._get_connection()
         cursor = conn.cursor()
         
+        doc_id = self._insert_document(cursor, vector_id, metadata)
+        
+        conn.commit()
+        conn.close()
+        
+        return doc_id
+    
+    def add_documents_bulk(
+        self,
+        rows: List[Tuple[str, Dict[str, Any]]]
+    ) -> Tuple[List[int], List[Tuple[str, Exception]]]:
+        """Add many documents in a single transaction.
+        
+        One commit (and fsync) covers every row. Rows whose vector ID is
+        already stored are skipped by SQLite; any other failing row is rolled
+        back to its savepoint and reported without aborting the rest.
+        
+        When the batch is at least BULK_INDEX_THRESHOLD rows and no smaller
+        than the table, the secondary indexes are dropped and rebuilt within
+        the same transaction, which is cheaper than updating them per row.
+        
+        Args:
+            rows: (vector_id, metadata) pairs
+            
+        Returns:
+            Tuple of (document IDs, [(vector_id, error)] for failed rows)
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        doc_ids = []
+        failures = []
+        
+        cursor.execute("BEGIN")
+        
+        defer_indexes = False
+        if len(rows) >= self.BULK_INDEX_THRESHOLD:
+            cursor.execute("SELECT COUNT(*) FROM documents")
+            defer_indexes = len(rows) >= cursor.fetchone()[0]
+        if defer_indexes:
+            for name in self.DEFERRABLE_INDEXES:
+                cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        
+        for vector_id, metadata in rows:
+            cursor.execute("SAVEPOINT add_document")
+            try:
+                doc_ids.append(self._insert_document(cursor, vector_id, metadata))
+            except Exception as e:
+                cursor.execute("ROLLBACK TO add_document")
+                failures.append((vector_id, e))
+            cursor.execute("RELEASE add_document")
+        
+        if defer_indexes:
+            self._create_indexes(cursor)
+        
+        conn.commit()
+        conn.close()
+        
+        return doc_ids, failures
+    
+    def delete_documents(self, vector_ids: Iterable[str]) -> int:
+        """Delete documents, with their themes, metadata, versions and relations.
+        
+        Args:
+            vector_ids: Vector store IDs of the documents to delete
+            
+        Returns:
+            Number of documents deleted
+        """
+        vector_ids = list(dict.fromkeys(vector_ids))
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        deleted = 0
+        cursor.execute("BEGIN")
+        for i in range(0, len(vector_ids), self.LOOKUP_BATCH_SIZE):
+            batch = vector_ids[i:i + self.LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            doc_ids = f"SELECT id FROM documents WHERE vector_id IN ({placeholders})"
+            
+            # Foreign keys are not enforced, so dependent rows go first
+            for table, column in (
+                ("document_themes", "doc_id"),
+                ("metadata", "doc_id"),
+                ("embedding_versions", "doc_id"),
+                ("relations", "from_doc_id"),
+                ("relations", "to_doc_id"),
+            ):
+                cursor.execute(f"DELETE FROM {table} WHERE {column} IN ({doc_ids})", batch)
+            cursor.execute(f"DELETE FROM documents WHERE vector_id IN ({placeholders})", batch)
+            deleted += cursor.rowcount
+        
+        conn.commit()
+        conn.close()
+        return deleted
+    
+    def _insert_document(
+        self,
+        cursor: sqlite3.Cursor,
+        vector_id: str,
+        metadata: Dict[str, Any]
+    ) -> int:
+        """Insert a document row with its themes, version and extra metadata.
+        
+        A vector ID that is already stored is left untouched.
+        
+        Args:
+            cursor: Database cursor (caller commits)
+            vector_id: ID from vector store (ChromaDB)
+            metadata: Full metadata dictionary
+            
+        Returns:
+            Document ID in knowledge store
+        """
         # Extract main fields
         doc_data = {
             "vector_id": vector_id,
@@ -188,23 +365,29 @@ class KnowledgeStore:
             "chunk_index": metadata.get("chunk_index"),
             "has_citation": 1 if metadata.get("has_citation", False) else 0,
             "created_at": metadata.get("ingested_at", datetime.utcnow().isoformat()),
+            "category": metadata.get("category"),
         }
         
-        # Insert document
+        # Insert document; duplicates are ignored by SQLite, not raised
         cursor.execute("""
-            INSERT INTO documents (
+            INSERT OR IGNORE INTO documents (
                 vector_id, title, source_type, authority_level, epistemic_origin,
                 language, region, discourse_position, chunk_role, sensitivity,
-                ingest_policy, folder_path, filename, chunk_index, has_citation, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ingest_policy, folder_path, filename, chunk_index, has_citation, created_at,
+                category
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, tuple(doc_data.values()))
         
+        if cursor.rowcount == 0:
+            cursor.execute("SELECT id FROM documents WHERE vector_id = ?", (vector_id,))
+            return cursor.fetchone()[0]
+        
         doc_id = cursor.lastrowid
         
         # Add themes
         themes = metadata.get("themes", [])
         if isinstance(themes, str):
-            themes = json.loads(themes)
+            themes = orjson.loads(themes)
         
         for theme_name in themes:
             theme_id = self._get_or_create_theme(cursor, theme_name)
@@ -225,20 +408,25 @@ class KnowledgeStore:
                 metadata.get("embedding_created_at", datetime.utcnow().isoformat())
             ))
         
-        # Store additional metadata in key-value table
-        excluded_keys = set(doc_data.keys()) | {"themes", "embedding_model", "embedding_version"}
-        for key, value in metadata.items():
-            if key not in excluded_keys and value is not None:
-                cursor.execute("""
-                    INSERT INTO metadata (doc_id, key, value)
-                    VALUES (?, ?, ?)
-                """, (doc_id, key, str(value)))
-        
-        conn.commit()
-        conn.close()
+        # Store additional metadata in key-value table; lists and dicts as JSON
+        excluded_keys = doc_data.keys() | {"themes", "embedding_model", "embedding_version"}
+        cursor.executemany("""
+            INSERT INTO metadata (doc_id, key, value)
+            VALUES (?, ?, ?)
+        """, [
+            (doc_id, key, orjson.dumps(value).decode() if isinstance(value, (list, dict)) else str(value))
+            for key, value in metadata.items()
+            if key not in excluded_keys and value is not None
+        ])
         
         return doc_id
     
+    def analyze(self):
+        """Refresh query planner statistics, e.g. after a bulk ingest."""
+        conn = self._get_connection()
+        conn.execute("ANALYZE")
+        conn.close()
+    
     def _get_or_create_theme(self, cursor, theme_name: str) -> int:
         """Get or create theme ID.
         
@@ -258,6 +446,62 @@ class KnowledgeStore:
         cursor.execute("INSERT INTO themes (name) VALUES (?)", (theme_name,))
         return cursor.lastrowid
     
+    def get_ingested_files(self) -> Dict[str, Tuple[float, int, Optional[str], Optional[int]]]:
+        """Get the manifest of ingested files.
+        
+        Returns:
+            Mapping of file path to (mtime, size, sha, chunk_count) at ingestion
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT filepath, mtime, size, sha, chunk_count FROM ingested_files")
+        manifest = {row[0]: (row[1], row[2], row[3], row[4]) for row in cursor.fetchall()}
+        
+        conn.close()
+        return manifest
+    
+    def mark_file_ingested(
+        self,
+        filepath: str,
+        mtime: float,
+        size: int,
+        sha: Optional[str] = None,
+        chunk_count: Optional[int] = None
+    ):
+        """Record a file as ingested with its current signature.
+        
+        Args:
+            filepath: Absolute file path
+            mtime: Modification time at ingestion
+            size: File size at ingestion
+            sha: SHA-256 of the file content, if known
+            chunk_count: Chunks stored for the file; None keeps the recorded count
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            INSERT INTO ingested_files (filepath, mtime, size, ingested_at, sha, chunk_count)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(filepath) DO UPDATE SET
+                mtime = excluded.mtime,
+                size = excluded.size,
+                ingested_at = excluded.ingested_at,
+                sha = excluded.sha,
+                chunk_count = COALESCE(excluded.chunk_count, ingested_files.chunk_count)
+        """, (filepath, mtime, size, datetime.utcnow().isoformat(), sha, chunk_count))
+        
+        conn.commit()
+        conn.close()
+    
+    def clear_ingested_files(self):
+        """Forget every ingested file, e.g. after the vector store was emptied."""
+        conn = self._get_connection()
+        conn.execute("DELETE FROM ingested_files")
+        conn.commit()
+        conn.close()
+    
     def get_document_by_vector_id(self, vector_id: str) -> Optional[Dict]:
         """Get document metadata by vector ID.
         
@@ -291,6 +535,50 @@ class KnowledgeStore:
         conn.close()
         return doc
     
+    def get_documents_metadata_batch(self, vector_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Get metadata of many documents with one query per batch.
+        
+        Replaces a get_document_by_vector_id call per hit (N+1 queries).
+        
+        Args:
+            vector_ids: Vector store IDs
+            
+        Returns:
+            Mapping of vector ID to document metadata (with themes);
+            unknown IDs are absent
+        """
+        vector_ids = list(dict.fromkeys(vector_ids))
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        docs = {}
+        for i in range(0, len(vector_ids), self.LOOKUP_BATCH_SIZE):
+            batch = vector_ids[i:i + self.LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            
+            cursor.execute(f"SELECT * FROM documents WHERE vector_id IN ({placeholders})", batch)
+            by_id = {}
+            for row in cursor.fetchall():
+                doc = dict(row)
+                doc['themes'] = []
+                docs[doc['vector_id']] = by_id[doc['id']] = doc
+            
+            if not by_id:
+                continue
+            
+            # Themes of the whole batch in one join
+            id_placeholders = ",".join("?" * len(by_id))
+            cursor.execute(f"""
+                SELECT dt.doc_id, t.name FROM themes t
+                JOIN document_themes dt ON t.id = dt.theme_id
+                WHERE dt.doc_id IN ({id_placeholders})
+            """, list(by_id))
+            for doc_id, theme_name in cursor.fetchall():
+                by_id[doc_id]['themes'].append(theme_name)
+        
+        conn.close()
+        return docs
+    
     def add_relation(
         self,
         from_vector_id: str,
@@ -338,6 +626,7 @@ class KnowledgeStore:
         epistemic_origin: Optional[str] = None,
         themes: Optional[List[str]] = None,
         language: Optional[str] = None,
+        category: Optional[str] = None,
         limit: int = 100
     ) -> List[str]:
         """Query documents by cultural/epistemic filters.
@@ -348,6 +637,7 @@ class KnowledgeStore:
             epistemic_origin: Filter by epistemic origin
             themes: Filter by themes (AND logic)
             language: Filter by language
+            category: Filter by ingestion category
             limit: Maximum results
             
         Returns:
@@ -376,6 +666,10 @@ class KnowledgeStore:
             where_clauses.append("language = ?")
             params.append(language)
         
+        if category:
+            where_clauses.append("category = ?")
+            params.append(category)
+        
         # Base query
         if themes:
             # Query with theme filtering
@@ -443,6 +737,21 @@ class KnowledgeStore:
         cursor.execute("SELECT COUNT(*) FROM themes")
         stats['total_themes'] = cursor.fetchone()[0]
         
+        # Most frequent themes, counted on the theme_id index
+        cursor.execute("""
+            SELECT t.name, tc.count
+            FROM (
+                SELECT theme_id, COUNT(*) as count
+                FROM document_themes
+                GROUP BY theme_id
+                ORDER BY count DESC
+                LIMIT ?
+            ) tc
+            JOIN themes t ON t.id = tc.theme_id
+            ORDER BY tc.count DESC
+        """, (self.TOP_THEMES_LIMIT,))
+        stats['top_themes'] = {row[0]: row[1] for row in cursor.fetchall()}
+        
         # Total relations
         cursor.execute("SELECT COUNT(*) FROM relations")
         stats['total_relations'] = cursor.fetchone()[0]
@@ -533,6 +842,30 @@ class KnowledgeStore:
         if row:
             return dict(row)
         return None
+    
+    def get_submissions_by_ids(self, submission_ids: Iterable[int]) -> Dict[int, Dict]:
+        """Get many submissions with one query per batch.
+        
+        Args:
+            submission_ids: Submission IDs
+            
+        Returns:
+            Mapping of submission ID to submission dictionary; unknown IDs are absent
+        """
+        submission_ids = list(dict.fromkeys(submission_ids))
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        submissions = {}
+        for i in range(0, len(submission_ids), self.LOOKUP_BATCH_SIZE):
+            batch = submission_ids[i:i + self.LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(f"SELECT * FROM submissions WHERE id IN ({placeholders})", batch)
+            for row in cursor.fetchall():
+                submissions[row["id"]] = dict(row)
+        
+        conn.close()
+        return submissions
 
     def update_submission_status(
         self, 
@@ -567,6 +900,50 @@ class KnowledgeStore:
         conn.commit()
         conn.close()
         return success
+    
+    def update_submissions_status(
+        self,
+        submission_ids: Iterable[int],
+        status: str,
+        curator_id: str,
+        note: Optional[str] = None
+    ) -> List[int]:
+        """Move pending submissions to a new status in one transaction.
+        
+        Only submissions still pending are changed, so two curators acting
+        on the same submission at once never both process it.
+        
+        Args:
+            submission_ids: Submission IDs
+            status: New status (approved/rejected)
+            curator_id: ID of curator
+            note: Optional note
+            
+        Returns:
+            IDs of the submissions actually updated
+        """
+        submission_ids = list(dict.fromkeys(submission_ids))
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        now = datetime.utcnow().isoformat()
+        updated = []
+        
+        cursor.execute("BEGIN IMMEDIATE")
+        for i in range(0, len(submission_ids), self.LOOKUP_BATCH_SIZE):
+            batch = submission_ids[i:i + self.LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(f"""
+                UPDATE submissions 
+                SET status = ?, curator_id = ?, curator_note = ?, updated_at = ?
+                WHERE status = 'pending' AND id IN ({placeholders})
+                RETURNING id
+            """, (status, curator_id, note, now, *batch))
+            updated.extend(row[0] for row in cursor.fetchall())
+        
+        conn.commit()
+        conn.close()
+        return updated
 
 
 # Global instance
@@ -0,0 +1,45 @@
+"""Non-blocking logging setup for the application.
+
+Records from every ``app.*`` logger go through a queue, and a background
+listener thread writes them to stdout. Worker threads (for example the
+directory loader pool) therefore never block on terminal I/O.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """Route ``app`` logging through a queue to a stdout writer thread.
+    
+    Safe to call more than once; later calls only adjust the level.
+    
+    Args:
+        level: Minimum level for the ``app`` logger
+    """
+    global _listener
+    
+    logger = logging.getLogger("app")
+    logger.setLevel(level)
+    
+    if _listener is not None:
+        return
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
@@ -76,6 +76,18 @@ class MetadataEnricher:
         ]
     }
     
+    # Defaults for scalar fields every stored chunk must carry; the list
+    # fields (themes, related_nodes) get a fresh list per chunk
+    DEFAULTS = {
+        'discourse_position': 'neutral',
+        'chunk_role': 'unknown',
+        'language': 'id',
+        'region': 'nusantara',
+        'sensitivity': 'standard',
+        'ingest_policy': 'cultural',
+        'has_citation': False,
+    }
+    
     def __init__(self):
         """Initialize metadata enricher."""
         pass
@@ -171,24 +183,62 @@ class MetadataEnricher:
             enriched['ingested_at'] = datetime.utcnow().isoformat()
         
         # Ensure required fields have defaults
-        defaults = {
-            'themes': [],
-            'related_nodes': [],
-            'discourse_position': 'neutral',
-            'chunk_role': 'unknown',
-            'language': 'id',
-            'region': 'nusantara',
-            'sensitivity': 'standard',
-            'ingest_policy': 'cultural',
-            'has_citation': False,
-        }
-        
-        for key, default_value in defaults.items():
+        enriched.setdefault('themes', [])
+        enriched.setdefault('related_nodes', [])
+        for key, default_value in self.DEFAULTS.items():
             if key not in enriched:
                 enriched[key] = default_value
         
         return enriched
     
+    def enrich_batch(
+        self,
+        metadatas: List[Dict],
+        contents: List[str],
+        overrides: Optional[Dict] = None
+    ) -> List[Dict[str, Any]]:
+        """Enrich the metadata of many chunks in one pass.
+        
+        Equivalent to calling ``enrich_metadata(metadata, content=content)``
+        per chunk and then updating with ``overrides``, except that all
+        chunks share one ingestion timestamp. Each result is built as a
+        single dict.
+        
+        Args:
+            metadatas: Base metadata per chunk
+            contents: Chunk contents, aligned with ``metadatas``
+            overrides: Fields applied on top of every result (e.g. embedding version)
+            
+        Returns:
+            Enriched metadata dictionaries
+        """
+        ingested_at = datetime.utcnow().isoformat()
+        high_keywords = self.SENSITIVITY_KEYWORDS["high"]
+        medium_keywords = self.SENSITIVITY_KEYWORDS["medium"]
+        overrides = overrides or {}
+        
+        results = []
+        for metadata, content in zip(metadatas, contents):
+            sensitivity = self.DEFAULTS['sensitivity']
+            if content and 'sensitivity' not in metadata:
+                content_lower = content.lower()
+                if sum(keyword in content_lower for keyword in high_keywords) >= 2:
+                    sensitivity = "high"
+                elif sum(keyword in content_lower for keyword in medium_keywords) >= 2:
+                    sensitivity = "medium"
+            
+            results.append({
+                'themes': [],
+                'related_nodes': [],
+                **self.DEFAULTS,
+                'sensitivity': sensitivity,
+                'ingested_at': ingested_at,
+                **metadata,
+                **overrides
+            })
+        
+        return results
+    
     def add_relations(
         self,
         metadata: Dict,
@@ -274,6 +324,38 @@ def merge_metadata(
     return enricher.enrich_metadata(base, curatorial, discourse)
 
 
+def embedding_prefix(metadata: Dict) -> str:
+    """Build the metadata prefix placed in front of chunk text.
+    
+    Title and source type are embedded together with the content in a
+    single string, rather than as a second text column with its own
+    embedding.
+    
+    Args:
+        metadata: Chunk metadata
+        
+    Returns:
+        Prefix of the form ``"[title|source_type] "``
+    """
+    return f"[{metadata.get('title', '')}|{metadata.get('source_type', '')}] "
+
+
+def strip_embedding_prefix(content: str, metadata: Dict) -> str:
+    """Remove the metadata prefix from stored chunk text for display.
+    
+    Args:
+        content: Stored chunk text
+        metadata: Chunk metadata
+        
+    Returns:
+        Chunk text without the prefix (unchanged if it has none)
+    """
+    prefix = embedding_prefix(metadata)
+    if content.startswith(prefix):
+        return content[len(prefix):]
+    return content
+
+
 def get_metadata_enricher() -> MetadataEnricher:
     """Factory function to get metadata enricher.
     
@@ -1,13 +1,19 @@
 """RAG chain combining retrieval and generation."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from langchain_core.documents import Document
-from langchain_core.runnables import RunnablePassthrough
+from langchain_core.runnables import RunnableLambda, RunnablePassthrough
 from langchain_core.output_parsers import StrOutputParser
+import asyncio
+import time
+import orjson
 
+from app.config import get_settings
 from app.core.llm import get_llm
+from app.core.metadata import strip_embedding_prefix
 from app.core.retriever import get_retriever
-from app.prompts.templates import get_qa_prompt, get_analysis_prompt, get_linguistic_prompt
+from app.core.vectorstore import get_qa_cache_collection
+from app.prompts.templates import render_qa, render_analysis, render_linguistic
 
 
 def format_docs(docs: List[Document]) -> str:
@@ -22,11 +28,16 @@ def format_docs(docs: List[Document]) -> str:
     formatted = []
     for i, doc in enumerate(docs, 1):
         source = doc.metadata.get("filename", doc.metadata.get("url", "Unknown"))
-        formatted.append(f"[Sumber {i}: {source}]\n{doc.page_content}")
+        content = strip_embedding_prefix(doc.page_content, doc.metadata)
+        formatted.append(f"[Sumber {i}: {source}]\n{content}")
     
     return "\n\n---\n\n".join(formatted)
 
 
+# Metadata keys exposed as source information
+SOURCE_KEYS = ("filename", "source_type", "url", "page", "chunk_index")
+
+
 def extract_sources(docs: List[Document]) -> List[Dict[str, Any]]:
     """Extract source information from documents.
     
@@ -36,20 +47,11 @@ def extract_sources(docs: List[Document]) -> List[Dict[str, Any]]:
     Returns:
         List of source metadata dictionaries
     """
-    sources = []
-    for doc in docs:
-        source_info = {
-            "filename": doc.metadata.get("filename"),
-            "source_type": doc.metadata.get("source_type"),
-            "url": doc.metadata.get("url"),
-            "page": doc.metadata.get("page"),
-            "chunk_index": doc.metadata.get("chunk_index"),
-        }
-        # Remove None values
-        source_info = {k: v for k, v in source_info.items() if v is not None}
-        sources.append(source_info)
-    
-    return sources
+    # Single pass per document, skipping None values
+    return [
+        {key: value for key in SOURCE_KEYS if (value := doc.metadata.get(key)) is not None}
+        for doc in docs
+    ]
 
 
 class RAGChain:
@@ -64,35 +66,119 @@ class RAGChain:
         """
         self.retriever = get_retriever(k=k)
         self.llm = get_llm(temperature=temperature)
-        self.prompt = get_qa_prompt()
+        self._chain = RunnableLambda(render_qa) | self.llm | StrOutputParser()
+        
+        # Answers depend on retrieval depth and sampling, so cache per config
+        self.settings = get_settings()
+        self.cache_namespace = f"qa:k={k}:t={temperature}"
+    
+    def _get_cached_answer(self, question: str) -> Optional[Dict[str, Any]]:
+        """Look up a previously generated answer for a similar question.
+        
+        Args:
+            question: User's question
+            
+        Returns:
+            Cached result dictionary, or None on a miss
+        """
+        cutoff = time.time() - self.settings.QA_CACHE_TTL_SECONDS
+        hits = get_qa_cache_collection().similarity_search_with_score(
+            question,
+            k=1,
+            filter={"$and": [
+                {"namespace": self.cache_namespace},
+                {"created_at": {"$gte": cutoff}},
+            ]}
+        )
+        
+        if not hits or hits[0][1] >= self.settings.QA_CACHE_MAX_DISTANCE:
+            return None
+        
+        meta = hits[0][0].metadata
+        return {
+            "answer": meta["answer"],
+            "sources": orjson.loads(meta["sources"]),
+            "context_used": meta["context_used"]
+        }
+    
+    def _cache_answer(self, question: str, result: Dict[str, Any]):
+        """Store a generated answer in the semantic cache.
+        
+        Args:
+            question: User's question
+            result: Result dictionary returned by invoke
+        """
+        get_qa_cache_collection().add_texts(
+            [question],
+            metadatas=[{
+                "namespace": self.cache_namespace,
+                "answer": result["answer"],
+                "sources": orjson.dumps(result["sources"]).decode(),
+                "context_used": result["context_used"],
+                "created_at": time.time(),
+            }]
+        )
     
     def invoke(self, question: str) -> Dict[str, Any]:
         """Process a question through the RAG pipeline.
         
+        Semantically similar questions asked recently are answered from
+        the QA cache instead of running retrieval and generation again.
+        
         Args:
             question: User's question
             
         Returns:
             Dictionary with answer and sources
         """
+        if self.settings.QA_CACHE_ENABLED:
+            cached = self._get_cached_answer(question)
+            if cached is not None:
+                return cached
+        
         # Retrieve relevant documents
-        docs = self.retriever.retrieve(question)
+        docs = self.retriever.retrieve_fast(question)
         
         # Format context
         context = format_docs(docs)
         
         # Generate answer
-        chain = self.prompt | self.llm | StrOutputParser()
-        answer = chain.invoke({
+        answer = self._chain.invoke({
             "context": context,
             "question": question
         })
         
-        return {
+        result = {
             "answer": answer,
             "sources": extract_sources(docs),
             "context_used": len(docs)
         }
+        
+        if self.settings.QA_CACHE_ENABLED:
+            self._cache_answer(question, result)
+        
+        return result
+    
+    async def astream(self, question: str) -> AsyncIterator[str]:
+        """Stream the answer as the LLM generates it.
+        
+        Retrieval runs in a worker thread, then answer chunks are yielded
+        as soon as the model emits them instead of after the full answer.
+        
+        Args:
+            question: User's question
+            
+        Yields:
+            Answer text chunks
+        """
+        docs = await asyncio.to_thread(self.retriever.retrieve_fast, question)
+        context = format_docs(docs)
+        
+        async for chunk in self._chain.astream({
+            "context": context,
+            "question": question
+        }):
+            yield chunk
     
     def invoke_with_scores(self, question: str) -> Dict[str, Any]:
         """Process question and include relevance scores.
@@ -112,8 +198,7 @@ class RAGChain:
         context = format_docs(docs)
         
         # Generate answer
-        chain = self.prompt | self.llm | StrOutputParser()
-        answer = chain.invoke({
+        answer = self._chain.invoke({
             "context": context,
             "question": question
         })
@@ -137,7 +222,7 @@ class AnalysisChain:
         """Initialize analysis chain with more context."""
         self.retriever = get_retriever(k=k)
         self.llm = get_llm(temperature=0.5)
-        self.prompt = get_analysis_prompt()
+        self._chain = RunnableLambda(render_analysis) | self.llm | StrOutputParser()
     
     def analyze(self, topic: str) -> Dict[str, Any]:
         """Perform analysis on a topic.
@@ -148,11 +233,10 @@ class AnalysisChain:
         Returns:
             Analysis result with sources
         """
-        docs = self.retriever.retrieve(topic)
+        docs = self.retriever.retrieve_fast(topic)
         context = format_docs(docs)
         
-        chain = self.prompt | self.llm | StrOutputParser()
-        analysis = chain.invoke({
+        analysis = self._chain.invoke({
             "context": context,
             "topic": topic
         })
@@ -170,7 +254,7 @@ class LinguisticChain:
         """Initialize linguistic chain."""
         self.retriever = get_retriever(k=k)
         self.llm = get_llm(temperature=0.3)
-        self.prompt = get_linguistic_prompt()
+        self._chain = RunnableLambda(render_linguistic) | self.llm | StrOutputParser()
     
     def analyze(self, question: str) -> Dict[str, Any]:
         """Perform linguistic analysis.
@@ -181,11 +265,10 @@ class LinguisticChain:
         Returns:
             Analysis result with sources
         """
-        docs = self.retriever.retrieve(question)
+        docs = self.retriever.retrieve_fast(question)
         context = format_docs(docs)
         
-        chain = self.prompt | self.llm | StrOutputParser()
-        analysis = chain.invoke({
+        analysis = self._chain.invoke({
             "context": context,
             "question": question
         })
@@ -19,6 +19,8 @@ class CulturalRetriever:
         settings = get_settings()
         self.k = k or settings.RETRIEVAL_K
         self.vectorstore = get_vectorstore()
+        self._collection = self.vectorstore._collection
+        self._embeddings = self.vectorstore.embeddings
     
     def retrieve(self, query: str) -> List[Document]:
         """Retrieve relevant documents for a query.
@@ -31,6 +33,30 @@ class CulturalRetriever:
         """
         return self.vectorstore.similarity_search(query, k=self.k)
     
+    def retrieve_fast(self, query: str) -> List[Document]:
+        """Retrieve relevant documents by querying the collection directly.
+        
+        Skips the LangChain wrapper (filter handling, result conversion) and
+        builds plain Documents from the raw query result.
+        
+        Args:
+            query: User query string
+            
+        Returns:
+            List of relevant documents
+        """
+        query_embedding = self._embeddings.embed_query(query)
+        results = self._collection.query(
+            query_embeddings=[query_embedding],
+            n_results=self.k,
+            include=["documents", "metadatas"]
+        )
+        
+        return [
+            Document(page_content=content, metadata=metadata or {})
+            for content, metadata in zip(results["documents"][0], results["metadatas"][0])
+        ]
+    
     def retrieve_with_scores(self, query: str) -> List[tuple]:
         """Retrieve documents with relevance scores.
         
@@ -7,9 +7,47 @@ from typing import List, Optional
 
 from app.config import get_settings
 from app.core.embeddings import get_embeddings
+from app.core.embedding_cache import get_cached_embeddings
+from app.core.knowledge_store import get_knowledge_store
 
 
+# Raised for a missing collection: ValueError before chromadb 0.6, NotFoundError since
+_MISSING_COLLECTION_ERRORS = (ValueError, getattr(chromadb.errors, "NotFoundError", ValueError))
+
+_client: Optional[chromadb.ClientAPI] = None
 _vectorstore: Optional[Chroma] = None
+_qa_cache: Optional[Chroma] = None
+
+
+def _get_client() -> chromadb.ClientAPI:
+    """Get or create the process-wide persistent ChromaDB client.
+    
+    Returns:
+        ChromaDB client bound to the configured persist directory
+    """
+    global _client
+    
+    if _client is None:
+        settings = get_settings()
+        _client = chromadb.PersistentClient(path=settings.CHROMA_PERSIST_DIR)
+    
+    return _client
+
+
+def _get_hnsw_metadata() -> dict:
+    """Get HNSW index configuration for the main collection.
+    
+    Returns:
+        Chroma collection metadata with HNSW parameters
+    """
+    settings = get_settings()
+    
+    return {
+        "hnsw:space": settings.CHROMA_HNSW_SPACE,
+        "hnsw:M": settings.CHROMA_HNSW_M,
+        "hnsw:construction_ef": settings.CHROMA_HNSW_CONSTRUCTION_EF,
+        "hnsw:search_ef": settings.CHROMA_HNSW_SEARCH_EF,
+    }
 
 
 def get_vectorstore() -> Chroma:
@@ -22,20 +60,42 @@ def get_vectorstore() -> Chroma:
     
     if _vectorstore is None:
         settings = get_settings()
-        embeddings = get_embeddings()
-        
-        # Initialize persistent ChromaDB client
-        client = chromadb.PersistentClient(path=settings.CHROMA_PERSIST_DIR)
+        embeddings = get_cached_embeddings()
         
         _vectorstore = Chroma(
-            client=client,
+            client=_get_client(),
             collection_name=settings.COLLECTION_NAME,
             embedding_function=embeddings,
+            collection_metadata=_get_hnsw_metadata(),
         )
     
     return _vectorstore
 
 
+def get_qa_cache_collection() -> Chroma:
+    """Get or create the question/answer cache collection.
+    
+    Cached questions live in their own collection on the shared client,
+    using cosine distance so hits can be matched against a fixed threshold.
+    
+    Returns:
+        Chroma vector store holding cached questions
+    """
+    global _qa_cache
+    
+    if _qa_cache is None:
+        settings = get_settings()
+        
+        _qa_cache = Chroma(
+            client=_get_client(),
+            collection_name=settings.QA_CACHE_COLLECTION_NAME,
+            embedding_function=get_embeddings(),
+            collection_metadata={"hnsw:space": "cosine"},
+        )
+    
+    return _qa_cache
+
+
 def add_documents(documents: List[Document]) -> List[str]:
     """Add documents to the vector store.
     
@@ -50,6 +110,22 @@ def add_documents(documents: List[Document]) -> List[str]:
     return ids
 
 
+def delete_documents_by_source(sources: List[str]) -> List[str]:
+    """Delete every chunk whose "source" metadata is one of the given paths.
+    
+    Args:
+        sources: Source paths as recorded on the chunks
+        
+    Returns:
+        IDs of the deleted chunks
+    """
+    vectorstore = get_vectorstore()
+    ids = vectorstore._collection.get(where={"source": {"$in": sources}}, include=[])["ids"]
+    if ids:
+        vectorstore.delete(ids=ids)
+    return ids
+
+
 def similarity_search(query: str, k: int = 4) -> List[Document]:
     """Perform similarity search on the vector store.
     
@@ -94,13 +170,39 @@ def get_collection_stats() -> dict:
 
 
 def delete_collection():
-    """Delete the entire collection. Use with caution."""
+    """Delete the entire collection. Use with caution.
+    
+    The answer cache is dropped as well, since cached answers were
+    generated from the deleted documents, and the ingested-files manifest
+    is cleared so the next ingest stores every file again.
+    """
     global _vectorstore
     settings = get_settings()
+    client = _get_client()
     
-    client = chromadb.PersistentClient(path=settings.CHROMA_PERSIST_DIR)
     try:
         client.delete_collection(settings.COLLECTION_NAME)
         _vectorstore = None
-    except ValueError:
+    except _MISSING_COLLECTION_ERRORS:
         pass  # Collection doesn't exist
+    
+    # Files recorded as ingested are no longer in the vector store
+    get_knowledge_store().clear_ingested_files()
+    
+    clear_qa_cache()
+
+
+def clear_qa_cache():
+    """Drop every cached answer.
+    
+    Called whenever the indexed documents change, since cached answers and
+    their sources only reflect the documents present when they were made.
+    """
+    global _qa_cache
+    settings = get_settings()
+    
+    try:
+        _get_client().delete_collection(settings.QA_CACHE_COLLECTION_NAME)
+    except _MISSING_COLLECTION_ERRORS:
+        pass
+    _qa_cache = None
@@ -41,11 +41,16 @@ def chunk_documents(documents: List[Document]) -> List[Document]:
         List of chunked documents with preserved metadata
     """
     splitter = get_text_splitter()
-    chunks = splitter.split_documents(documents)
+    chunks = []
     
-    # Add chunk index to metadata
-    for i, chunk in enumerate(chunks):
-        chunk.metadata["chunk_index"] = i
+    # Build each chunk's metadata once (shallow copy + chunk index) instead
+    # of split_documents' per-chunk deepcopy followed by a second update
+    for doc in documents:
+        for text in splitter.split_text(doc.page_content):
+            chunks.append(Document(
+                page_content=text,
+                metadata={**doc.metadata, "chunk_index": len(chunks)}
+            ))
     
     return chunks
 
@@ -61,13 +66,9 @@ def chunk_text(text: str, metadata: dict = None) -> List[Document]:
         List of Document objects
     """
     splitter = get_text_splitter()
-    chunks = splitter.create_documents(
-        texts=[text],
-        metadatas=[metadata or {}]
-    )
-    
-    # Add chunk indices
-    for i, chunk in enumerate(chunks):
-        chunk.metadata["chunk_index"] = i
+    base_metadata = metadata or {}
     
-    return chunks
+    return [
+        Document(page_content=chunk, metadata={**base_metadata, "chunk_index": i})
+        for i, chunk in enumerate(splitter.split_text(text))
+    ]
@@ -5,10 +5,13 @@ metadata about knowledge provenance, authority level, and cultural context
 from the file path and content before documents enter the RAG pipeline.
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from pydantic import BaseModel, Field
 from enum import Enum
+import os
 import re
 
 
@@ -40,6 +43,26 @@ class CuratorialMetadata(BaseModel):
     region: str = Field(default="nusantara", description="Geographic/cultural region")
     ingest_policy: str = Field(default="cultural", description="Ingestion policy applied")
     folder_path: str = Field(..., description="Relative folder path from knowledge_base")
+
+
+@dataclass(slots=True, kw_only=True)
+class CuratorialMetadataFast:
+    """Curatorial metadata for the ingestion hot path.
+    
+    Same fields as CuratorialMetadata, but without validation: every value
+    is produced by the gate itself.
+    """
+    source_type: str
+    authority_level: AuthorityLevel
+    epistemic_origin: EpistemicOrigin
+    language: str = "id"
+    region: str = "nusantara"
+    ingest_policy: str = "cultural"
+    folder_path: str
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain metadata dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
     
 
 class CuratorialGate:
@@ -75,6 +98,9 @@ class CuratorialGate:
         r'\bdengan\b', r'\buntuk\b', r'\bpada\b', r'\badalah\b'
     ]
     
+    # Folders whose path-derived metadata is kept
+    FOLDER_CACHE_SIZE = 1024
+    
     def __init__(self, knowledge_base_root: str = "./knowledge_base"):
         """Initialize curatorial gate.
         
@@ -82,6 +108,7 @@ class CuratorialGate:
             knowledge_base_root: Root path of knowledge base
         """
         self.knowledge_base_root = Path(knowledge_base_root)
+        self._folder_metadata_cached = lru_cache(maxsize=self.FOLDER_CACHE_SIZE)(self._folder_metadata)
     
     def extract_source_type(self, file_path: str) -> str:
         """Extract source type from folder structure.
@@ -162,19 +189,17 @@ class CuratorialGate:
         # If 3 or more Indonesian patterns found, classify as Indonesian
         return "id" if indonesian_matches >= 3 else "en"
     
-    def extract_region(self, metadata: Dict) -> str:
+    def extract_region(self, language: str = "id") -> str:
         """Extract or infer regional/cultural context.
         
         Args:
-            metadata: Existing metadata dictionary
+            language: Detected primary language code
             
         Returns:
             Region identifier
         """
         # For now, use simple heuristic
         # Can be extended to parse from metadata or content
-        language = metadata.get("language", "id")
-        
         if language == "id":
             return "nusantara"
         return "global"
@@ -195,7 +220,29 @@ class CuratorialGate:
         except ValueError:
             return str(path.parent)
     
-    def apply_curatorial_policy(self, metadata: CuratorialMetadata) -> CuratorialMetadata:
+    def _folder_metadata(self, folder: str) -> Tuple[str, AuthorityLevel, EpistemicOrigin, str]:
+        """Derive the metadata shared by every file in a folder.
+        
+        Source type, authority, origin and folder path depend only on the
+        file's directory, so they are computed once per folder.
+        
+        Args:
+            folder: Directory containing the file
+            
+        Returns:
+            Tuple of (source_type, authority_level, epistemic_origin, folder_path)
+        """
+        # Any file name in the folder yields the same path-derived values
+        representative = os.path.join(folder, "_")
+        source_type = self.extract_source_type(representative)
+        return (
+            source_type,
+            self.determine_authority_level(source_type),
+            self.determine_epistemic_origin(source_type),
+            self.get_folder_path(representative),
+        )
+    
+    def apply_curatorial_policy(self, metadata: CuratorialMetadataFast) -> CuratorialMetadataFast:
         """Apply cultural ingestion policy based on metadata.
         
         This is where we can add special handling for different source types.
@@ -218,7 +265,7 @@ class CuratorialGate:
         file_path: str,
         content: Optional[str] = None,
         existing_metadata: Optional[Dict] = None
-    ) -> CuratorialMetadata:
+    ) -> CuratorialMetadataFast:
         """Main curatorial function to enrich document with epistemic metadata.
         
         Args:
@@ -227,14 +274,12 @@ class CuratorialGate:
             existing_metadata: Optional existing metadata to merge
             
         Returns:
-            CuratorialMetadata with full epistemic context
+            CuratorialMetadataFast with full epistemic context
         """
-        # Extract source type from folder structure
-        source_type = self.extract_source_type(file_path)
-        
-        # Determine authority and origin
-        authority_level = self.determine_authority_level(source_type)
-        epistemic_origin = self.determine_epistemic_origin(source_type)
+        # Source type, authority, origin and folder come from the folder
+        source_type, authority_level, epistemic_origin, folder_path = self._folder_metadata_cached(
+            os.path.dirname(file_path)
+        )
         
         # Detect language if content provided
         language = "id"  # Default
@@ -243,11 +288,8 @@ class CuratorialGate:
         elif existing_metadata and "language" in existing_metadata:
             language = existing_metadata["language"]
         
-        # Get folder path
-        folder_path = self.get_folder_path(file_path)
-        
         # Create base metadata
-        metadata = CuratorialMetadata(
+        metadata = CuratorialMetadataFast(
             source_type=source_type,
             authority_level=authority_level,
             epistemic_origin=epistemic_origin,
@@ -258,7 +300,7 @@ class CuratorialGate:
         )
         
         # Extract region
-        metadata.region = self.extract_region(metadata.dict())
+        metadata.region = self.extract_region(metadata.language)
         
         # Apply curatorial policy
         metadata = self.apply_curatorial_policy(metadata)
@@ -5,11 +5,33 @@ argumentative roles, and thematic coherence rather than just splitting by tokens
 Each chunk becomes a unit of meaning with associated metadata.
 """
 
-from typing import List, Dict, Optional, Literal
+from typing import Iterable, Iterator, List, Dict, Optional, Literal, Set, Tuple
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from pydantic import BaseModel, Field
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+import atexit
+import hashlib
+import multiprocessing
+import os
 import re
+import threading
+
+try:
+    import ahocorasick  # Optional: single-pass keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan  # Optional: SIMD multi-pattern matching
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2  # Optional: linear-time DFA regex engine
+except ImportError:
+    re2 = None
 
 from app.config import get_settings
 
@@ -33,63 +55,210 @@ DiscoursePosition = Literal[
 ]
 
 
-class DiscourseMetadata(BaseModel):
-    """Metadata for discourse-aware chunks."""
-    chunk_role: ChunkRole = Field(default="unknown", description="Role in discourse")
-    discourse_position: DiscoursePosition = Field(default="neutral", description="Stance/position")
-    themes: List[str] = Field(default_factory=list, description="Detected themes")
-    has_citation: bool = Field(default=False, description="Contains citations/references")
+def _compile(patterns: List[str], flags: int = re.IGNORECASE) -> List[re.Pattern]:
+    """Precompile a pattern group once, at import time.
+    
+    Args:
+        patterns: Regex pattern strings
+        flags: Regex flags (case-insensitive by default)
+        
+    Returns:
+        List of compiled patterns
+    """
+    return [re.compile(pattern, flags) for pattern in patterns]
+
+
+def _fuse(patterns: List[re.Pattern], overlapping: bool = False) -> re.Pattern:
+    """Fuse a compiled pattern group into one alternation.
+    
+    Args:
+        patterns: Compiled patterns sharing the same flags
+        overlapping: Wrap the alternation in a lookahead so finditer() reports
+            every keyword occurrence, including overlapping ones; each member
+            gets its own group, so ``match.lastindex`` names the one that matched
+        
+    Returns:
+        Single compiled pattern matching any member of the group
+    """
+    if overlapping:
+        alternation = "|".join(f"({pattern.pattern})" for pattern in patterns)
+        alternation = f"(?=(?:{alternation}))"
+    else:
+        alternation = "|".join(f"(?:{pattern.pattern})" for pattern in patterns)
+    return re.compile(alternation, patterns[0].flags)
+
+
+def content_hash(text: str) -> str:
+    """Hash chunk text so identical chunks can be recognized downstream.
+    
+    Args:
+        text: Chunk text
+        
+    Returns:
+        Hex digest of the text
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _to_re2(pattern: re.Pattern):
+    """Recompile a fused pattern with RE2.
+    
+    RE2's ``\\d`` is ASCII-only, so it is widened to the Unicode digit class
+    that Python's ``re`` uses; case-insensitivity becomes an inline flag.
+    
+    Args:
+        pattern: Compiled stdlib pattern without lookarounds or ``\\b``/``\\w``
+        
+    Returns:
+        Equivalent RE2 pattern with the same search() API
+    """
+    source = pattern.pattern.replace(r'\d', r'\p{Nd}')
+    if pattern.flags & re.IGNORECASE:
+        source = f"(?i){source}"
+    return re2.compile(source)
+
+
+def _literals(patterns: List[re.Pattern]) -> Tuple[str, ...]:
+    """Unescape a group of literal-only patterns into plain lowercase strings.
     
+    Args:
+        patterns: Compiled patterns without regex operators
+        
+    Returns:
+        Tuple of literal keywords for ``in`` checks
+    """
+    return tuple(pattern.pattern.replace('\\', '').lower() for pattern in patterns)
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of up to ``size`` items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character counts as a regex word character."""
+    return char.isalnum() or char == "_"
+
 
 class DiscourseAwareChunker:
     """Chunker that understands discourse structure and meaning."""
     
     # Patterns for detecting discourse roles
-    ARGUMENT_PATTERNS = [
+    ARGUMENT_PATTERNS = _compile([
         r'oleh karena itu', r'maka', r'dengan demikian',
         r'therefore', r'thus', r'consequently'
-    ]
+    ])
     
-    COUNTER_PATTERNS = [
+    COUNTER_PATTERNS = _compile([
         r'namun', r'tetapi', r'akan tetapi', r'sebaliknya',
         r'however', r'but', r'nevertheless', r'on the contrary'
-    ]
+    ])
     
-    DEFINITION_PATTERNS = [
+    DEFINITION_PATTERNS = _compile([
         r'adalah', r'merupakan', r'didefinisikan',
         r'is defined as', r'refers to', r'means'
-    ]
+    ])
     
-    EXAMPLE_PATTERNS = [
+    EXAMPLE_PATTERNS = _compile([
         r'misalnya', r'contohnya', r'sebagai contoh',
         r'for example', r'for instance', r'such as'
-    ]
+    ])
     
-    QUESTION_PATTERNS = [
+    QUESTION_PATTERNS = _compile([
         r'bagaimana', r'mengapa', r'apa', r'siapa', r'kapan', r'dimana',
         r'how', r'why', r'what', r'who', r'when', r'where', r'\?'
-    ]
+    ])
     
     # Patterns for thematic keywords
     THEME_KEYWORDS = {
-        "technology": [r'teknologi', r'digital', r'internet', r'technology', r'software'],
-        "power": [r'kekuasaan', r'hegemoni', r'dominasi', r'power', r'hegemony'],
-        "culture": [r'budaya', r'kultur', r'tradisi', r'culture', r'tradition'],
-        "language": [r'bahasa', r'linguistik', r'language', r'linguistic'],
-        "identity": [r'identitas', r'jati diri', r'identity', r'self'],
-        "colonialism": [r'kolonial', r'penjajah', r'colonial', r'imperialism'],
-        "resistance": [r'perlawanan', r'resistensi', r'resistance', r'opposition'],
+        "technology": _compile([r'teknologi', r'digital', r'internet', r'technology', r'software']),
+        "power": _compile([r'kekuasaan', r'hegemoni', r'dominasi', r'power', r'hegemony']),
+        "culture": _compile([r'budaya', r'kultur', r'tradisi', r'culture', r'tradition']),
+        "language": _compile([r'bahasa', r'linguistik', r'language', r'linguistic']),
+        "identity": _compile([r'identitas', r'jati diri', r'identity', r'self']),
+        "colonialism": _compile([r'kolonial', r'penjajah', r'colonial', r'imperialism']),
+        "resistance": _compile([r'perlawanan', r'resistensi', r'resistance', r'opposition']),
+    }
+    
+    # Storytelling elements: past tense verbs, temporal markers
+    NARRATIVE_PATTERNS = _compile([r'\btelah\b', r'\bpernah\b', r'\bdahulu\b', r'\bhistory\b'])
+    
+    # Stance markers for discourse position
+    CRITICAL_PATTERNS = _compile([
+        r'masalah', r'kritik', r'problem', r'issue', r'concern',
+        r'tidak', r'bukan', r'not', r'never'
+    ])
+    
+    SUPPORTIVE_PATTERNS = _compile([
+        r'mendukung', r'setuju', r'positif', r'support', r'agree',
+        r'baik', r'good', r'beneficial'
+    ])
+    
+    # Citation markers are case-sensitive
+    CITATION_PATTERNS = _compile([
+        r'\(\d{4}\)',  # Year citations like (2023)
+        r'\[\d+\]',    # Reference numbers like [1]
+        r'et al\.',    # Academic citations
+        r'ibid',       # Latin reference markers
+    ], flags=0)
+    
+    # Role keywords are plain literals, checked with str.__contains__
+    ARGUMENT_LITERALS = _literals(ARGUMENT_PATTERNS)
+    COUNTER_LITERALS = _literals(COUNTER_PATTERNS)
+    DEFINITION_LITERALS = _literals(DEFINITION_PATTERNS)
+    EXAMPLE_LITERALS = _literals(EXAMPLE_PATTERNS)
+    QUESTION_LITERALS = _literals(QUESTION_PATTERNS)
+    
+    # Word-bounded narrative markers are whole tokens
+    NARRATIVE_TOKENS = frozenset(
+        pattern.pattern.replace(r'\b', '') for pattern in NARRATIVE_PATTERNS
+    )
+    WORD_RE = re.compile(r'\w+')
+    
+    # One alternation per group, so each group is a single scan of the chunk
+    CRITICAL_RE = _fuse(CRITICAL_PATTERNS, overlapping=True)
+    SUPPORTIVE_RE = _fuse(SUPPORTIVE_PATTERNS, overlapping=True)
+    CITATION_RE = _fuse(CITATION_PATTERNS)
+    
+    # Inverted theme index: literal keyword -> theme
+    KEYWORD_TO_THEME = {
+        keyword: theme
+        for theme, patterns in THEME_KEYWORDS.items()
+        for keyword in _literals(patterns)
     }
     
-    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
+    # Distinct chunk texts whose classification is memoized per chunker
+    ANALYZE_CACHE_SIZE = 4096
+    
+    # Keyword groups matched by the Aho-Corasick automaton, in role priority order
+    ROLE_GROUPS = [
+        ("question", "QUESTION_PATTERNS"),
+        ("definition", "DEFINITION_PATTERNS"),
+        ("example", "EXAMPLE_PATTERNS"),
+        ("counter_argument", "COUNTER_PATTERNS"),
+        ("argument", "ARGUMENT_PATTERNS"),
+        ("narrative", "NARRATIVE_PATTERNS"),
+    ]
+    
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        parallel_min_docs: int = 0
+    ):
         """Initialize discourse chunker.
         
         Args:
             chunk_size: Target size for chunks
             chunk_overlap: Overlap between chunks
+            parallel_min_docs: Chunk in worker processes from this many
+                documents; 0 always chunks in-process
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.parallel_min_docs = parallel_min_docs
         
         # Fallback to basic splitter for non-semantic splitting
         self.basic_splitter = RecursiveCharacterTextSplitter(
@@ -97,6 +266,209 @@ class DiscourseAwareChunker:
             chunk_overlap=chunk_overlap,
             separators=["\n\n", "\n", ". ", ", ", " ", ""]
         )
+        
+        # Multi-pattern matchers, fastest available first
+        self._hs_database = None
+        self._hs_scratch = None
+        self._automaton = None
+        if hyperscan:
+            self._hs_database, self._hs_ids = self._build_hyperscan_database()
+            self._hs_scratch = hyperscan.Scratch(self._hs_database)
+        elif ahocorasick:
+            self._automaton = self._build_automaton()
+        
+        # RE2 runs the citation alternation in linear time. The stance patterns
+        # need lookahead and the word patterns Unicode \w, so they stay on re.
+        if re2:
+            self.CITATION_RE = _to_re2(self.CITATION_RE)
+        
+        # Repeated boilerplate (headers, footers, reference lists) yields
+        # identical chunks; classify each distinct text only once
+        self._analyze_cached = lru_cache(maxsize=self.ANALYZE_CACHE_SIZE)(self._analyze)
+    
+    def _keyword_groups(self) -> List[Tuple[str, List[re.Pattern]]]:
+        """List every keyword group scanned by the multi-pattern matchers.
+        
+        Returns:
+            (group name, compiled patterns) pairs
+        """
+        groups = [(role, getattr(self, attr)) for role, attr in self.ROLE_GROUPS]
+        groups.append(("critical", self.CRITICAL_PATTERNS))
+        groups.append(("supportive", self.SUPPORTIVE_PATTERNS))
+        groups.extend(
+            (f"theme:{theme}", patterns) for theme, patterns in self.THEME_KEYWORDS.items()
+        )
+        return groups
+    
+    def _build_hyperscan_database(self):
+        """Compile every keyword group, plus citations, into one Hyperscan database.
+        
+        Each expression id maps back to its (group, pattern, word_bounded) entry.
+        Hyperscan only knows ASCII word boundaries, so ``\\b`` anchors are stripped
+        and checked against the Unicode-aware neighbours in the match callback;
+        unanchored expressions report at most one match per scan. UCP gives
+        ``\\d`` and friends the Unicode meaning Python's ``re`` uses.
+        
+        Returns:
+            Tuple of (hyperscan.Database, list of (group, pattern, word_bounded) by id)
+        """
+        groups = self._keyword_groups()
+        groups.append(("citation", self.CITATION_PATTERNS))
+        
+        ids = []
+        expressions = []
+        flags = []
+        for group, patterns in groups:
+            for pattern in patterns:
+                word_bounded = pattern.pattern.startswith(r'\b')
+                expression = pattern.pattern.replace(r'\b', '') if word_bounded else pattern.pattern
+                ids.append((group, pattern.pattern, word_bounded))
+                expressions.append(expression.encode("utf-8"))
+                pattern_flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                if word_bounded:
+                    pattern_flags |= hyperscan.HS_FLAG_SOM_LEFTMOST
+                else:
+                    pattern_flags |= hyperscan.HS_FLAG_SINGLEMATCH
+                if pattern.flags & re.IGNORECASE:
+                    pattern_flags |= hyperscan.HS_FLAG_CASELESS
+                flags.append(pattern_flags)
+        
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=flags
+        )
+        
+        return database, ids
+    
+    def _scan_hyperscan(self, chunk_text: str) -> Dict[str, Set[str]]:
+        """Collect matched patterns per group with one Hyperscan scan.
+        
+        Args:
+            chunk_text: Chunk text (case handled by the database flags)
+            
+        Returns:
+            Mapping of group name to the distinct patterns found
+        """
+        hits: Dict[str, Set[str]] = {}
+        data = chunk_text.encode("utf-8", "ignore")
+        
+        def on_match(expression_id, start, end, flags, context):
+            group, pattern, word_bounded = self._hs_ids[expression_id]
+            if word_bounded:
+                before = data[max(start - 4, 0):start].decode("utf-8", "ignore")[-1:]
+                after = data[end:end + 4].decode("utf-8", "ignore")[:1]
+                if (before and _is_word_char(before)) or (after and _is_word_char(after)):
+                    return None
+            hits.setdefault(group, set()).add(pattern)
+        
+        self._hs_database.scan(
+            data,
+            match_event_handler=on_match,
+            scratch=self._hs_scratch
+        )
+        
+        return hits
+    
+    def _build_automaton(self):
+        """Build one Aho-Corasick automaton over every keyword group.
+        
+        Patterns are plain keywords, optionally wrapped in word-boundary anchors; each
+        keyword maps to the (group, keyword, word_bounded) entries it belongs to.
+        
+        Returns:
+            Finalized ahocorasick.Automaton
+        """
+        entries: Dict[str, List[Tuple[str, str, bool]]] = {}
+        for group, patterns in self._keyword_groups():
+            for pattern in patterns:
+                word_bounded = pattern.pattern.startswith(r'\b')
+                keyword = pattern.pattern.replace(r'\b', '').replace('\\', '')
+                entries.setdefault(keyword, []).append((group, keyword, word_bounded))
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, payload in entries.items():
+            automaton.add_word(keyword, (len(keyword), tuple(payload)))
+        automaton.make_automaton()
+        
+        return automaton
+    
+    def _scan_keywords(self, text_lower: str) -> Dict[str, Set[str]]:
+        """Collect matched keywords per group in a single pass.
+        
+        Args:
+            text_lower: Lowercased chunk text
+            
+        Returns:
+            Mapping of group name to the distinct keywords found
+        """
+        hits: Dict[str, Set[str]] = {}
+        text_len = len(text_lower)
+        
+        for end, (length, payload) in self._automaton.iter(text_lower):
+            start = end - length + 1
+            for group, keyword, word_bounded in payload:
+                if word_bounded and (
+                    (start > 0 and _is_word_char(text_lower[start - 1]))
+                    or (end + 1 < text_len and _is_word_char(text_lower[end + 1]))
+                ):
+                    continue
+                hits.setdefault(group, set()).add(keyword)
+        
+        return hits
+    
+    def _analyze(self, chunk_text: str) -> Tuple[ChunkRole, DiscoursePosition, Tuple[str, ...], bool]:
+        """Classify role, position, themes and citations of a chunk.
+        
+        Uses one Hyperscan or Aho-Corasick pass when either library is
+        installed and falls back to the individual classifiers otherwise.
+        
+        Args:
+            chunk_text: Text to analyze
+            
+        Returns:
+            Tuple of (chunk_role, discourse_position, themes, has_citation)
+        """
+        if self._hs_database is not None:
+            hits = self._scan_hyperscan(chunk_text)
+            has_citation = "citation" in hits
+        elif self._automaton is not None:
+            # The automaton matches lowercase keywords; this is the only copy made
+            hits = self._scan_keywords(chunk_text.lower())
+            has_citation = self.detect_citation(chunk_text)
+        else:
+            chunk_role = self.classify_chunk_role(chunk_text)
+            return (
+                chunk_role,
+                self.detect_discourse_position(chunk_text, chunk_role),
+                tuple(self.extract_themes(chunk_text)),
+                self.detect_citation(chunk_text),
+            )
+        
+        chunk_role = next(
+            (role for role, _ in self.ROLE_GROUPS if role in hits),
+            "unknown"
+        )
+        
+        if chunk_role == "counter_argument":
+            discourse_position = "critical"
+        elif chunk_role == "question":
+            discourse_position = "questioning"
+        else:
+            critical_count = len(hits.get("critical", ()))
+            supportive_count = len(hits.get("supportive", ()))
+            if critical_count > supportive_count:
+                discourse_position = "critical"
+            elif supportive_count > critical_count:
+                discourse_position = "supportive"
+            else:
+                discourse_position = "neutral"
+        
+        themes = tuple(theme for theme in self.THEME_KEYWORDS if f"theme:{theme}" in hits)
+        
+        return chunk_role, discourse_position, themes, has_citation
     
     def semantic_split(self, text: str) -> List[str]:
         """Split text by semantic boundaries (paragraphs, arguments).
@@ -111,7 +483,9 @@ class DiscourseAwareChunker:
         paragraphs = text.split('\n\n')
         
         chunks = []
-        current_chunk = ""
+        # Paragraphs of the current chunk and its joined length
+        current_buf: List[str] = []
+        current_len = 0
         
         for para in paragraphs:
             para = para.strip()
@@ -119,20 +493,21 @@ class DiscourseAwareChunker:
                 continue
             
             # If adding paragraph would exceed chunk size, start new chunk
-            if len(current_chunk) + len(para) > self.chunk_size and current_chunk:
-                chunks.append(current_chunk.strip())
+            if current_len + len(para) > self.chunk_size and current_buf:
+                chunks.append("\n\n".join(current_buf).strip())
                 # Start new chunk with overlap
-                current_chunk = para
+                current_buf = [para]
+                current_len = len(para)
             else:
                 # Add to current chunk
-                if current_chunk:
-                    current_chunk += "\n\n" + para
-                else:
-                    current_chunk = para
+                if current_buf:
+                    current_len += 2
+                current_buf.append(para)
+                current_len += len(para)
         
         # Add remaining chunk
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if current_buf:
+            chunks.append("\n\n".join(current_buf).strip())
         
         # If no semantic splits possible, fallback to basic splitter
         if not chunks:
@@ -152,29 +527,27 @@ class DiscourseAwareChunker:
         text_lower = chunk_text.lower()
         
         # Check for question patterns
-        if any(re.search(pattern, text_lower) for pattern in self.QUESTION_PATTERNS):
+        if any(keyword in text_lower for keyword in self.QUESTION_LITERALS):
             return "question"
         
         # Check for definition patterns
-        if any(re.search(pattern, text_lower) for pattern in self.DEFINITION_PATTERNS):
+        if any(keyword in text_lower for keyword in self.DEFINITION_LITERALS):
             return "definition"
         
         # Check for example patterns
-        if any(re.search(pattern, text_lower) for pattern in self.EXAMPLE_PATTERNS):
+        if any(keyword in text_lower for keyword in self.EXAMPLE_LITERALS):
             return "example"
         
         # Check for counter-argument patterns
-        if any(re.search(pattern, text_lower) for pattern in self.COUNTER_PATTERNS):
+        if any(keyword in text_lower for keyword in self.COUNTER_LITERALS):
             return "counter_argument"
         
         # Check for argument patterns
-        if any(re.search(pattern, text_lower) for pattern in self.ARGUMENT_PATTERNS):
+        if any(keyword in text_lower for keyword in self.ARGUMENT_LITERALS):
             return "argument"
         
         # Check if it's narrative (contains storytelling elements)
-        # Simple heuristic: presence of past tense verbs, temporal markers
-        narrative_markers = [r'\btelah\b', r'\bpernah\b', r'\bdahulu\b', r'\bhistory\b']
-        if any(re.search(pattern, text_lower) for pattern in narrative_markers):
+        if not self.NARRATIVE_TOKENS.isdisjoint(self.WORD_RE.findall(text_lower)):
             return "narrative"
         
         return "unknown"
@@ -189,8 +562,6 @@ class DiscourseAwareChunker:
         Returns:
             Discourse position
         """
-        text_lower = chunk_text.lower()
-        
         # Counter-arguments are typically critical
         if chunk_role == "counter_argument":
             return "critical"
@@ -199,19 +570,12 @@ class DiscourseAwareChunker:
         if chunk_role == "question":
             return "questioning"
         
-        # Look for critical language
-        critical_markers = [
-            r'masalah', r'kritik', r'problem', r'issue', r'concern',
-            r'tidak', r'bukan', r'not', r'never'
-        ]
-        critical_count = sum(1 for pattern in critical_markers if re.search(pattern, text_lower))
+        # Look for critical language (distinct markers, not occurrences).
+        # Markers are told apart by group index, so no lowercased copies are made.
+        critical_count = len({match.lastindex for match in self.CRITICAL_RE.finditer(chunk_text)})
         
         # Look for supportive language
-        supportive_markers = [
-            r'mendukung', r'setuju', r'positif', r'support', r'agree',
-            r'baik', r'good', r'beneficial'
-        ]
-        supportive_count = sum(1 for pattern in supportive_markers if re.search(pattern, text_lower))
+        supportive_count = len({match.lastindex for match in self.SUPPORTIVE_RE.finditer(chunk_text)})
         
         if critical_count > supportive_count:
             return "critical"
@@ -230,13 +594,15 @@ class DiscourseAwareChunker:
             List of detected theme tags
         """
         text_lower = chunk_text.lower()
-        detected_themes = []
+        found = set()
         
-        for theme, patterns in self.THEME_KEYWORDS.items():
-            if any(re.search(pattern, text_lower) for pattern in patterns):
-                detected_themes.append(theme)
+        # Keywords match inside words too (e.g. "teknologinya"), so each one is a
+        # substring test; a theme's remaining keywords are skipped once it is found
+        for keyword, theme in self.KEYWORD_TO_THEME.items():
+            if theme not in found and keyword in text_lower:
+                found.add(theme)
         
-        return detected_themes
+        return [theme for theme in self.THEME_KEYWORDS if theme in found]
     
     def detect_citation(self, chunk_text: str) -> bool:
         """Detect if chunk contains citations or references.
@@ -247,22 +613,26 @@ class DiscourseAwareChunker:
         Returns:
             True if citations detected
         """
-        citation_patterns = [
-            r'\(\d{4}\)',  # Year citations like (2023)
-            r'\[\d+\]',    # Reference numbers like [1]
-            r'et al\.',    # Academic citations
-            r'ibid',       # Latin reference markers
-        ]
+        # Literal markers need no regex at all
+        if "et al." in chunk_text or "ibid" in chunk_text:
+            return True
+        
+        # Year and reference-number citations need a bracket; most chunks have none
+        if "(" not in chunk_text and "[" not in chunk_text:
+            return False
         
-        return any(re.search(pattern, chunk_text) for pattern in citation_patterns)
+        return self.CITATION_RE.search(chunk_text) is not None
     
     def chunk_with_discourse(
         self, 
-        documents: List[Document],
+        documents: Iterable[Document],
         curatorial_metadata: Optional[Dict] = None
     ) -> List[Document]:
         """Main chunking function with discourse awareness.
         
+        Documents may be any iterable, including a lazy loader; they are
+        consumed in bounded batches.
+        
         Args:
             documents: Documents to chunk
             curatorial_metadata: Optional curatorial metadata to preserve
@@ -270,50 +640,128 @@ class DiscourseAwareChunker:
         Returns:
             List of discourse-aware chunks
         """
+        cpu_count = os.cpu_count() or 1
         result_chunks = []
         
-        for doc in documents:
-            # Semantic split
-            text_chunks = self.semantic_split(doc.page_content)
+        # Classifying a document takes microseconds, so worker processes only
+        # pay off for very large batches; by default everything runs here
+        if self.parallel_min_docs <= 0 or cpu_count < 2:
+            for doc in documents:
+                result_chunks.extend(self._chunk_document(doc, curatorial_metadata))
+            return result_chunks
+        
+        batch_size = max(self.parallel_min_docs, 8 * cpu_count)
+        for batch in _batched(documents, batch_size):
+            if len(batch) < self.parallel_min_docs:
+                for doc in batch:
+                    result_chunks.extend(self._chunk_document(doc, curatorial_metadata))
+                continue
             
-            for i, chunk_text in enumerate(text_chunks):
-                # Classify discourse metadata
-                chunk_role = self.classify_chunk_role(chunk_text)
-                discourse_position = self.detect_discourse_position(chunk_text, chunk_role)
-                themes = self.extract_themes(chunk_text)
-                has_citation = self.detect_citation(chunk_text)
-                
-                # Create discourse metadata
-                discourse_meta = DiscourseMetadata(
-                    chunk_role=chunk_role,
-                    discourse_position=discourse_position,
-                    themes=themes,
-                    has_citation=has_citation
-                )
-                
-                # Merge with document metadata
-                chunk_metadata = doc.metadata.copy()
-                chunk_metadata.update({
-                    "chunk_index": i,
-                    "chunk_role": discourse_meta.chunk_role,
-                    "discourse_position": discourse_meta.discourse_position,
-                    "themes": discourse_meta.themes,
-                    "has_citation": discourse_meta.has_citation,
-                })
-                
-                # Add curatorial metadata if provided
-                if curatorial_metadata:
-                    chunk_metadata.update(curatorial_metadata)
-                
-                # Create chunk document
-                chunk_doc = Document(
-                    page_content=chunk_text,
-                    metadata=chunk_metadata
-                )
-                
-                result_chunks.append(chunk_doc)
+            # Compiled matchers cannot be pickled; each worker builds its own chunker
+            results = _get_executor().map(
+                partial(
+                    _process_doc,
+                    chunk_size=self.chunk_size,
+                    chunk_overlap=self.chunk_overlap,
+                    curatorial_metadata=curatorial_metadata
+                ),
+                batch,
+                chunksize=max(1, len(batch) // (4 * cpu_count))
+            )
+            result_chunks.extend(chunk for chunks in results for chunk in chunks)
         
         return result_chunks
+    
+    def _chunk_document(
+        self,
+        doc: Document,
+        curatorial_metadata: Optional[Dict] = None
+    ) -> List[Document]:
+        """Split and classify a single document.
+        
+        Args:
+            doc: Document to chunk
+            curatorial_metadata: Optional curatorial metadata to preserve
+            
+        Returns:
+            List of discourse-aware chunks for the document
+        """
+        result_chunks = []
+        
+        # Semantic split
+        text_chunks = self.semantic_split(doc.page_content)
+        
+        # Document and curatorial metadata are the same for every chunk
+        base_meta = {**doc.metadata, **(curatorial_metadata or {})}
+        
+        for i, chunk_text in enumerate(text_chunks):
+            # Classify discourse metadata (identical chunks share one result)
+            chunk_role, discourse_position, themes, has_citation = self._analyze_cached(chunk_text)
+            
+            # Merge discourse fields with document and curatorial metadata;
+            # classifier outputs need no validation
+            chunk_metadata = {
+                **base_meta,
+                "chunk_index": i,
+                "chunk_role": chunk_role,
+                "discourse_position": discourse_position,
+                "themes": list(themes),
+                "has_citation": has_citation,
+                "content_hash": content_hash(chunk_text),
+            }
+            
+            # Create chunk document
+            chunk_doc = Document(
+                page_content=chunk_text,
+                metadata=chunk_metadata
+            )
+            
+            result_chunks.append(chunk_doc)
+        
+        return result_chunks
+
+
+# Process pool shared by every chunker, created on first parallel batch
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Per-process chunkers used by chunk_with_discourse workers, by (size, overlap)
+_worker_chunkers: Dict[Tuple[int, int], DiscourseAwareChunker] = {}
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Get or create the long-lived chunking process pool.
+    
+    Workers are spawned rather than forked, since callers may already run
+    other threads whose locks a forked child would inherit.
+    
+    Returns:
+        ProcessPoolExecutor shut down at interpreter exit
+    """
+    global _executor
+    
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(_executor.shutdown)
+    
+    return _executor
+
+
+def _process_doc(
+    doc: Document,
+    chunk_size: int,
+    chunk_overlap: int,
+    curatorial_metadata: Optional[Dict] = None
+) -> List[Document]:
+    """Chunk one document inside a worker process."""
+    key = (chunk_size, chunk_overlap)
+    if key not in _worker_chunkers:
+        _worker_chunkers[key] = DiscourseAwareChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    return _worker_chunkers[key]._chunk_document(doc, curatorial_metadata)
 
 
 def get_discourse_chunker(
@@ -333,5 +781,6 @@ def get_discourse_chunker(
     
     return DiscourseAwareChunker(
         chunk_size=chunk_size or settings.CHUNK_SIZE,
-        chunk_overlap=chunk_overlap or settings.CHUNK_OVERLAP
+        chunk_overlap=chunk_overlap or settings.CHUNK_OVERLAP,
+        parallel_min_docs=settings.DISCOURSE_PARALLEL_MIN_DOCS
     )
@@ -1,15 +1,44 @@
 """Document loaders for various file formats."""
 
+import hashlib
+import logging
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from langchain_core.documents import Document
-from langchain_community.document_loaders import (
-    PyPDFLoader,
-    TextLoader,
-    UnstructuredMarkdownLoader,
-    WebBaseLoader,
-)
+
+logger = logging.getLogger(__name__)
+
+# LangChain loaders are imported on first use: UnstructuredMarkdownLoader
+# alone pulls in unstructured, NLTK and lxml.
+
+
+def _make_loader_factory(file_type: str) -> Callable:
+    """Import the loader class for a file type.
+    
+    Args:
+        file_type: Loader file type (pdf/text/markdown)
+        
+    Returns:
+        Callable taking a file path and returning a document loader
+        
+    Raises:
+        ValueError: If there is no loader for the file type
+    """
+    if file_type == "pdf":
+        from langchain_community.document_loaders import PyPDFLoader
+        return PyPDFLoader
+    elif file_type == "text":
+        from langchain_community.document_loaders import TextLoader
+        return partial(TextLoader, encoding="utf-8")
+    elif file_type == "markdown":
+        from langchain_community.document_loaders import UnstructuredMarkdownLoader
+        return UnstructuredMarkdownLoader
+    
+    raise ValueError(f"No loader for file type: {file_type}")
 
 
 class DocumentLoaderFactory:
@@ -22,6 +51,9 @@ class DocumentLoaderFactory:
         ".markdown": "markdown",
     }
     
+    # Loader factory per file type, filled in on first use
+    _LOADER_FACTORIES: Dict[str, Callable] = {}
+    
     @classmethod
     def get_loader(cls, file_path: str):
         """Get appropriate loader for a file.
@@ -42,72 +74,129 @@ class DocumentLoaderFactory:
         
         file_type = cls.SUPPORTED_EXTENSIONS[ext]
         
-        if file_type == "pdf":
-            return PyPDFLoader(file_path)
-        elif file_type == "text":
-            return TextLoader(file_path, encoding="utf-8")
-        elif file_type == "markdown":
-            return UnstructuredMarkdownLoader(file_path)
+        factory = cls._LOADER_FACTORIES.get(file_type)
+        if factory is None:
+            factory = cls._LOADER_FACTORIES[file_type] = _make_loader_factory(file_type)
         
-        raise ValueError(f"No loader for file type: {file_type}")
+        return factory(file_path)
+
+
+# Extensions ingest_file and load_directory can handle
+SUPPORTED_EXTS = frozenset(DocumentLoaderFactory.SUPPORTED_EXTENSIONS)
+
+# Directories never holding knowledge documents; not descended into
+SKIP_DIRS = frozenset({".git", ".hg", ".svn", "node_modules", "__pycache__", ".venv", "venv"})
 
+# Bytes read per step when hashing a file
+HASH_BLOCK_SIZE = 1 << 20
 
-def load_pdf(file_path: str) -> List[Document]:
-    """Load a PDF file.
+
+def file_sha256(file_path: str) -> str:
+    """Hash a file's bytes in one streaming pass.
     
     Args:
-        file_path: Path to PDF file
+        file_path: Path to the file
+        
+    Returns:
+        Hex SHA-256 digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        # hashlib.file_digest needs Python 3.11; read in blocks instead
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_text(file_path: str) -> Tuple[str, str]:
+    """Read a UTF-8 file once, hashing the same bytes that are decoded.
+    
+    Newlines are normalized as Python's text mode would.
+    
+    Args:
+        file_path: Path to the file
         
     Returns:
-        List of documents (one per page)
+        Tuple of (text, hex SHA-256 digest of the file content)
+    """
+    data = Path(file_path).read_bytes()
+    text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return text, hashlib.sha256(data).hexdigest()
+
+
+def load_pdf(file_path: str) -> Iterator[Document]:
+    """Load a PDF file lazily, one page at a time.
+    
+    Args:
+        file_path: Path to PDF file
+        
+    Yields:
+        Documents (one per page)
     """
+    from langchain_community.document_loaders import PyPDFLoader
+    
     loader = PyPDFLoader(file_path)
-    documents = loader.load()
+    filename = Path(file_path).name
+    file_sha = file_sha256(file_path)
     
     # Add source metadata
-    for doc in documents:
+    for doc in loader.lazy_load():
         doc.metadata["source_type"] = "pdf"
-        doc.metadata["filename"] = Path(file_path).name
-    
-    return documents
+        doc.metadata["filename"] = filename
+        doc.metadata["file_sha"] = file_sha
+        yield doc
 
 
-def load_text(file_path: str) -> List[Document]:
-    """Load a text file.
+def load_text(file_path: str) -> Iterator[Document]:
+    """Load a text file lazily.
     
     Args:
         file_path: Path to text file
         
-    Returns:
-        List containing one document
+    Yields:
+        One document
     """
-    loader = TextLoader(file_path, encoding="utf-8")
-    documents = loader.load()
-    
-    for doc in documents:
-        doc.metadata["source_type"] = "text"
-        doc.metadata["filename"] = Path(file_path).name
+    text, file_sha = _read_text(file_path)
     
-    return documents
+    yield Document(page_content=text, metadata={
+        "source": str(file_path),
+        "source_type": "text",
+        "filename": Path(file_path).name,
+        "file_sha": file_sha,
+    })
 
 
-def load_markdown(file_path: str) -> List[Document]:
-    """Load a markdown file.
+def load_markdown(file_path: str) -> Iterator[Document]:
+    """Load a markdown file lazily.
+    
+    Partitions the already-read text the way UnstructuredMarkdownLoader
+    does in single mode, so the file is read once for parsing and hashing.
     
     Args:
         file_path: Path to markdown file
         
-    Returns:
-        List of documents
+    Yields:
+        One document
     """
-    loader = UnstructuredMarkdownLoader(file_path)
-    documents = loader.load()
+    from unstructured.partition.md import partition_md
     
-    for doc in documents:
-        doc.metadata["source_type"] = "markdown"
-        doc.metadata["filename"] = Path(file_path).name
+    text, file_sha = _read_text(file_path)
+    elements = partition_md(text=text)
     
-    return documents
+    yield Document(page_content="\n\n".join(str(element) for element in elements), metadata={
+        "source": str(file_path),
+        "source_type": "markdown",
+        "filename": Path(file_path).name,
+        "file_sha": file_sha,
+    })
+
+
+# Loader per DocumentLoaderFactory file type, each reading a file once
+_FILE_LOADERS = {
+    "pdf": load_pdf,
+    "text": load_text,
+    "markdown": load_markdown,
+}
 
 
 def load_url(url: str) -> List[Document]:
@@ -119,6 +208,8 @@ def load_url(url: str) -> List[Document]:
     Returns:
         List of documents
     """
+    from langchain_community.document_loaders import WebBaseLoader
+    
     loader = WebBaseLoader(url)
     documents = loader.load()
     
@@ -129,51 +220,180 @@ def load_url(url: str) -> List[Document]:
     return documents
 
 
-def load_directory(
+async def load_urls_async(urls: List[str], max_concurrency: int = 10) -> List[Document]:
+    """Fetch many URLs concurrently.
+    
+    Pages are downloaded over aiohttp with at most ``max_concurrency``
+    requests in flight; a URL that fails to load is skipped.
+    
+    Args:
+        urls: Web URLs to scrape
+        max_concurrency: Maximum simultaneous requests
+        
+    Returns:
+        List of documents, one per successfully fetched URL
+    """
+    from langchain_community.document_loaders import WebBaseLoader
+    
+    loader = WebBaseLoader(
+        web_paths=urls,
+        requests_per_second=max_concurrency,
+        continue_on_failure=True,
+        show_progress=False
+    )
+    
+    documents = []
+    async for doc in loader.alazy_load():
+        # Failed fetches come back as empty pages
+        if not doc.page_content.strip():
+            logger.error("[ERROR] Error loading %s", doc.metadata.get("source"))
+            continue
+        
+        doc.metadata["source_type"] = "web"
+        doc.metadata["url"] = doc.metadata.get("source")
+        documents.append(doc)
+    
+    return documents
+
+
+# Loading is I/O-bound (disk reads, PDF parsing), so threads overlap well
+LOAD_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _iter_files(directory: str, recursive: bool, extensions: Tuple[str, ...]) -> Iterator[Path]:
+    """Walk a directory with os.scandir, yielding files with a wanted extension.
+    
+    DirEntry caches its type from the directory listing, so filtering costs
+    no extra stat() per entry; a Path is only built for files that match.
+    Directories in SKIP_DIRS (VCS metadata, node_modules, ...) are pruned.
+    A missing or unreadable directory yields nothing, as Path.glob did.
+    
+    Args:
+        directory: Directory to walk
+        recursive: Whether to descend into subdirectories
+        extensions: Lowercase extensions to include
+        
+    Yields:
+        Paths of matching files
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+    
+    with entries:
+        for entry in entries:
+            if entry.is_file():
+                if entry.name.lower().endswith(extensions):
+                    yield Path(entry.path)
+            elif recursive and entry.name not in SKIP_DIRS and entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path, recursive, extensions)
+
+
+def _load_one(file_path: Path) -> Tuple[Path, List[Document], Optional[Exception]]:
+    """Load and tag a single file for load_directory_iter.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        Tuple of (file_path, documents, error); documents is empty on error
+    """
+    try:
+        ext = file_path.suffix.lower()
+        if ext not in DocumentLoaderFactory.SUPPORTED_EXTENSIONS:
+            raise ValueError(f"Unsupported file type: {ext}")
+        # Loaders tag source type, filename and content hash
+        docs = list(_FILE_LOADERS[DocumentLoaderFactory.SUPPORTED_EXTENSIONS[ext]](str(file_path)))
+    except Exception as e:
+        return file_path, [], e
+    
+    for doc in docs:
+        doc.metadata["filepath"] = str(file_path)
+    
+    return file_path, docs, None
+
+
+def load_directory_iter(
     directory_path: str,
     recursive: bool = True,
-    extensions: Optional[List[str]] = None
-) -> List[Document]:
-    """Load all supported documents from a directory.
+    extensions: Optional[List[str]] = None,
+    skip: Optional[Callable[[Path], bool]] = None
+) -> Iterator[Tuple[str, List[Document]]]:
+    """Load all supported files from a directory, one file at a time.
+    
+    Files load concurrently on a thread pool but are yielded in directory
+    order. The walk itself is lazy and at most a small window of files is
+    held in memory, so memory use is bounded by the largest file rather
+    than the whole tree. A file that fails to load is reported and skipped.
     
     Args:
         directory_path: Path to directory
         recursive: Whether to search subdirectories
         extensions: List of extensions to include (e.g., [".pdf", ".md"])
+        skip: Optional predicate; files for which it returns True are not loaded
         
-    Returns:
-        List of all loaded documents
+    Yields:
+        Tuples of (file_path, documents)
     """
-    documents = []
-    path = Path(directory_path)
-    
     if extensions is None:
-        extensions = list(DocumentLoaderFactory.SUPPORTED_EXTENSIONS.keys())
+        extensions = SUPPORTED_EXTS
     
     # Normalize extensions
-    extensions = [ext if ext.startswith(".") else f".{ext}" for ext in extensions]
-    
-    # Find all matching files
-    pattern = "**/*" if recursive else "*"
-    
-    for file_path in path.glob(pattern):
-        if file_path.is_file() and file_path.suffix.lower() in extensions:
-            try:
-                loader = DocumentLoaderFactory.get_loader(str(file_path))
-                docs = loader.load()
-                
-                # Add metadata
-                for doc in docs:
-                    doc.metadata["source_type"] = DocumentLoaderFactory.SUPPORTED_EXTENSIONS.get(
-                        file_path.suffix.lower(), "unknown"
-                    )
-                    doc.metadata["filename"] = file_path.name
-                    doc.metadata["filepath"] = str(file_path)
-                
-                documents.extend(docs)
-                print(f"[OK] Loaded: {file_path.name} ({len(docs)} chunks)")
-                
-            except Exception as e:
-                print(f"[ERROR] Error loading {file_path}: {e}")
+    extensions = tuple(
+        (ext if ext.startswith(".") else f".{ext}").lower() for ext in extensions
+    )
     
-    return documents
+    # Walk matching files lazily
+    file_iter = _iter_files(directory_path, recursive, extensions)
+    if skip is not None:
+        file_iter = (file_path for file_path in file_iter if not skip(file_path))
+    
+    with ThreadPoolExecutor(max_workers=LOAD_MAX_WORKERS) as executor:
+        # Keep a bounded window of in-flight loads so memory stays flat
+        pending = deque()
+        
+        for file_path in file_iter:
+            pending.append(executor.submit(_load_one, file_path))
+            if len(pending) >= 2 * LOAD_MAX_WORKERS:
+                break
+        
+        loaded = 0
+        errors = 0
+        
+        while pending:
+            file_path, docs, error = pending.popleft().result()
+            
+            next_path = next(file_iter, None)
+            if next_path is not None:
+                pending.append(executor.submit(_load_one, next_path))
+            
+            if error is not None:
+                errors += 1
+                logger.error("[ERROR] Error loading %s: %s", file_path, error)
+                continue
+            
+            loaded += 1
+            logger.info("[OK] Loaded: %s (%d chunks)", file_path.name, len(docs))
+            yield str(file_path), docs
+        
+        logger.info("Loaded %d files (%d errors)", loaded, errors)
+
+
+def load_directory(
+    directory_path: str,
+    recursive: bool = True,
+    extensions: Optional[List[str]] = None
+) -> Iterator[Document]:
+    """Load all supported documents from a directory.
+    
+    Args:
+        directory_path: Path to directory
+        recursive: Whether to search subdirectories
+        extensions: List of extensions to include (e.g., [".pdf", ".md"])
+        
+    Yields:
+        Loaded documents, grouped by file
+    """
+    for _, docs in load_directory_iter(directory_path, recursive, extensions):
+        yield from docs
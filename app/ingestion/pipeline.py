@@ -8,21 +8,43 @@ This pipeline implements epistemic awareness through:
 5. Dual Storage - Vector store + Knowledge store
 """
 
+import asyncio
+import logging
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sized, Tuple
+import multiprocessing
+import os
+import queue
+import threading
 
 from langchain_core.documents import Document
 
-from app.ingestion.loaders import load_directory, load_url, load_pdf, load_text, load_markdown
+from app.ingestion.loaders import (
+    LOAD_MAX_WORKERS, file_sha256, load_directory_iter, load_url, load_urls_async,
+    load_pdf, load_text, load_markdown
+)
 from app.ingestion.curator import get_curator
 from app.ingestion.discourse_chunker import get_discourse_chunker
-from app.ingestion.chunker import chunk_documents  # Fallback
-from app.core.metadata import get_metadata_enricher
+from app.ingestion.chunker import chunk_documents, chunk_text  # Fallback
+from app.core.metadata import embedding_prefix, get_metadata_enricher
 from app.core.embedding_version import get_current_embedding_metadata
-from app.core.vectorstore import add_documents, get_collection_stats
+from app.core.vectorstore import (
+    add_documents, clear_qa_cache, delete_documents_by_source, get_collection_stats
+)
 from app.core.knowledge_store import get_knowledge_store
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
+
+# Loader per file extension for ingest_file
+_LOADERS = {
+    ".pdf": load_pdf,
+    ".md": load_markdown,
+    ".markdown": load_markdown,
+    ".txt": load_text,
+}
+
 
 class IngestionPipeline:
     """Culturally-aware ingestion pipeline.
@@ -32,11 +54,26 @@ class IngestionPipeline:
     → [Metadata Enrichment] → [Embedding (versioned)] → [Dual Storage]
     """
     
+    # Prepared files buffered between the producer thread and storage
+    PREPARED_QUEUE_SIZE = 4
+    
+    # Characters read per window when streaming a text file
+    STREAM_BLOCK_CHARS = 1 << 20
+    
+    # Curatorial metadata for URLs (treated as media by default)
+    URL_PROVENANCE = {
+        "source_type": "media",
+        "authority_level": "media",
+        "epistemic_origin": "media_discourse",
+        "language": "en",
+        "region": "global"
+    }
+    
     def __init__(self, verbose: bool = True):
         """Initialize pipeline.
         
         Args:
-            verbose: Whether to print progress messages
+            verbose: Whether to log progress messages
         """
         self.verbose = verbose
         self.settings = get_settings()
@@ -47,10 +84,19 @@ class IngestionPipeline:
         self.metadata_enricher = get_metadata_enricher()
         self.knowledge_store = get_knowledge_store()
     
-    def _log(self, message: str):
-        """Print message if verbose mode is enabled."""
-        if self.verbose:
-            print(message)
+    def _log(self, message: str, *args, level: int = logging.INFO):
+        """Log a progress message.
+        
+        Messages are formatted lazily. Below WARNING they are only emitted
+        in verbose mode, so a quiet pipeline skips formatting entirely.
+        
+        Args:
+            message: %-style format string
+            *args: Format arguments
+            level: Logging level
+        """
+        if self.verbose or level >= logging.WARNING:
+            logger.log(level, message, *args)
     
     def _apply_curatorial_gate(
         self,
@@ -75,14 +121,14 @@ class IngestionPipeline:
             content=sample_content
         )
         
-        # Add to all documents
-        curatorial_dict = curatorial_meta.dict()
+        # Build the dict once and merge the same object into every document
+        curatorial_dict = curatorial_meta.to_dict()
         for doc in documents:
             doc.metadata.update(curatorial_dict)
         
-        self._log(f"    Source: {curatorial_meta.source_type}")
-        self._log(f"    Authority: {curatorial_meta.authority_level.value}")
-        self._log(f"    Origin: {curatorial_meta.epistemic_origin.value}")
+        self._log("    Source: %s", curatorial_meta.source_type)
+        self._log("    Authority: %s", curatorial_meta.authority_level.value)
+        self._log("    Origin: %s", curatorial_meta.epistemic_origin.value)
         
         return documents
     
@@ -103,19 +149,9 @@ class IngestionPipeline:
         if use_discourse and self.settings.USE_DISCOURSE_CHUNKING:
             self._log("[CHUNK] Discourse-aware chunking...")
             
-            # Extract curatorial metadata to pass along
-            curatorial_meta = {}
-            if documents:
-                curatorial_meta = {
-                    k: v for k, v in documents[0].metadata.items()
-                    if k in ['source_type', 'authority_level', 'epistemic_origin', 
-                            'language', 'region', 'ingest_policy', 'folder_path']
-                }
-            
-            chunks = self.discourse_chunker.chunk_with_discourse(
-                documents,
-                curatorial_metadata=curatorial_meta
-            )
+            # Curatorial fields are already in every document's metadata
+            # (curatorial gate / URL policy), so nothing is merged again
+            chunks = self.discourse_chunker.chunk_with_discourse(documents)
         else:
             self._log("[CHUNK] Basic chunking...")
             chunks = chunk_documents(documents)
@@ -133,50 +169,94 @@ class IngestionPipeline:
         """
         self._log("[ENRICH] Enriching metadata...")
         
-        # Add embedding version to all chunks
+        # Embedding version is built once and folded into every chunk's dict
         embedding_meta = get_current_embedding_metadata()
         
-        for chunk in chunks:
-            # Enrich with all metadata sources
-            enriched_meta = self.metadata_enricher.enrich_metadata(
-                base_metadata=chunk.metadata,
-                content=chunk.page_content
-            )
-            
-            # Add embedding version
-            enriched_meta.update(embedding_meta)
-            
+        enriched_metas = self.metadata_enricher.enrich_batch(
+            [chunk.metadata for chunk in chunks],
+            [chunk.page_content for chunk in chunks],
+            overrides=embedding_meta
+        )
+        
+        for chunk, enriched_meta in zip(chunks, enriched_metas):
             # Update chunk metadata
             chunk.metadata = enriched_meta
+            
+            # Embed title and source type with the text (strip for display)
+            if self.settings.EMBED_METADATA_PREFIX:
+                chunk.page_content = embedding_prefix(enriched_meta) + chunk.page_content
         
         return chunks
     
-    def _store_dual(self, chunks: List[Document]) -> List[str]:
+    def _store_dual(self, chunks: List[Document], batch_size: Optional[int] = None) -> List[str]:
         """Store in dual system: Vector store + Knowledge store.
         
         Args:
             chunks: Chunks to store
+            batch_size: Chunks embedded and added per vector store call
+                (defaults to CHROMA_BATCH_SIZE)
             
         Returns:
             List of vector IDs
         """
-        self._log(f"[STORE] Dual storage: {len(chunks)} chunks...")
+        self._log("[STORE] Dual storage: %d chunks...", len(chunks))
         
-        # Store in vector store (ChromaDB)
-        vector_ids = add_documents(chunks)
+        # Store in vector store (ChromaDB) in fixed-size batches
+        batch_size = batch_size or self.settings.CHROMA_BATCH_SIZE
+        vector_ids = []
+        for i in range(0, len(chunks), batch_size):
+            vector_ids.extend(add_documents(chunks[i:i + batch_size]))
         
-        # Store in knowledge store (SQLite)
-        for vector_id, chunk in zip(vector_ids, chunks):
-            try:
-                self.knowledge_store.add_document(
-                    vector_id=vector_id,
-                    metadata=chunk.metadata
-                )
-            except Exception as e:
-                self._log(f"    [WARN] Knowledge store error for {vector_id}: {e}")
+        # Store in knowledge store (SQLite), one transaction for all chunks
+        _, failures = self.knowledge_store.add_documents_bulk(
+            [(vector_id, chunk.metadata) for vector_id, chunk in zip(vector_ids, chunks)]
+        )
+        for vector_id, e in failures:
+            self._log("    [WARN] Knowledge store error for %s: %s", vector_id, e, level=logging.WARNING)
+        
+        # Cached answers predate these chunks and would never cite them
+        if vector_ids:
+            clear_qa_cache()
         
         return vector_ids
     
+    def _content_unchanged(self, file_path: str, sha: str) -> bool:
+        """Check whether a file still has the content hash recorded for it.
+        
+        Hashing is much cheaper than parsing, so a file that was only
+        touched is recognised before it is loaded.
+        
+        Args:
+            file_path: Path to the file
+            sha: SHA-256 recorded in the manifest
+            
+        Returns:
+            True if the file's current content hashes to ``sha``
+        """
+        try:
+            return file_sha256(file_path) == sha
+        except OSError:
+            return False  # Reported by the loader
+    
+    def _delete_file_chunks(self, file_path: str):
+        """Delete the chunks stored by an earlier ingest of a file.
+        
+        Chunks record the path the file was loaded under, which may have
+        been relative or absolute, so every spelling of it is matched.
+        
+        Args:
+            file_path: Path of the file being re-ingested
+        """
+        key = os.path.abspath(file_path)
+        relative = os.path.relpath(key)
+        sources = list(dict.fromkeys([file_path, key, relative, os.path.join(".", relative)]))
+        
+        vector_ids = delete_documents_by_source(sources)
+        if vector_ids:
+            self.knowledge_store.delete_documents(vector_ids)
+            clear_qa_cache()
+            self._log("[DELETE] %d stale chunks of %s", len(vector_ids), Path(file_path).name)
+    
     def ingest_file(self, file_path: str, category: str = "general") -> int:
         """Ingest a single file with full Cultural Nodes pipeline.
         
@@ -188,26 +268,12 @@ class IngestionPipeline:
             Number of chunks ingested
         """
         path = Path(file_path)
-        ext = path.suffix.lower()
         
-        self._log(f"\n[FILE] Ingesting: {path.name}")
-        self._log("="*60)
+        self._log("\n[FILE] Ingesting: %s", path.name)
+        self._log("=" * 60)
         
         # 1. LOAD
-        self._log("[LOAD] Loading document...")
-        if ext == ".pdf":
-            documents = load_pdf(file_path)
-        elif ext in [".md", ".markdown"]:
-            documents = load_markdown(file_path)
-        elif ext == ".txt":
-            documents = load_text(file_path)
-        else:
-            raise ValueError(f"Unsupported file type: {ext}")
-        
-        # Add category metadata
-        for doc in documents:
-            doc.metadata["category"] = category
-            doc.metadata["title"] = doc.metadata.get("filename", path.stem)
+        documents = self._load_file(file_path, category)
         
         # 2. CURATORIAL GATE
         documents = self._apply_curatorial_gate(documents, file_path)
@@ -221,75 +287,510 @@ class IngestionPipeline:
         # 5. DUAL STORAGE
         vector_ids = self._store_dual(chunks)
         
-        self._log(f"\n[DONE] {path.name}: {len(chunks)} chunks stored")
-        self._log("="*60)
+        self._log("\n[DONE] %s: %d chunks stored", path.name, len(chunks))
+        self._log("=" * 60)
         
         return len(chunks)
     
+    def _load_file(self, file_path: str, category: str) -> List[Document]:
+        """Load a single file and tag it with category and title.
+        
+        Args:
+            file_path: Path to the file
+            category: Category tag for the document
+            
+        Returns:
+            Loaded documents
+            
+        Raises:
+            ValueError: If the file type is not supported
+        """
+        path = Path(file_path)
+        ext = path.suffix.lower()
+        
+        self._log("[LOAD] Loading document...")
+        loader = _LOADERS.get(ext)
+        if loader is None:
+            raise ValueError(f"Unsupported file type: {ext}")
+        documents = list(loader(file_path))
+        
+        # Add category metadata
+        for doc in documents:
+            doc.metadata["category"] = category
+            doc.metadata["title"] = doc.metadata.get("filename", path.stem)
+        
+        return documents
+    
+    def _iter_file_windows(self, file_path: str) -> Iterator[Document]:
+        """Read a file as a sequence of bounded documents.
+        
+        PDFs are yielded page by page. Text files are read in blocks of
+        STREAM_BLOCK_CHARS and cut at the last paragraph break, so the
+        carried-over tail never splits a paragraph.
+        
+        Args:
+            file_path: Path to a .txt or .pdf file
+            
+        Yields:
+            Documents, one per page or window
+        """
+        path = Path(file_path)
+        if path.suffix.lower() == ".pdf":
+            yield from load_pdf(file_path)
+            return
+        
+        # No content hash: windows are stored before the file is fully
+        # read, and nothing on this path consults one
+        base_metadata = {
+            "source": file_path,
+            "source_type": "text",
+            "filename": path.name,
+        }
+        
+        carry = ""
+        window = 0
+        with open(file_path, encoding="utf-8") as f:
+            while True:
+                block = f.read(self.STREAM_BLOCK_CHARS)
+                text = carry + block
+                carry = ""
+                
+                if block:
+                    cut = text.rfind("\n\n")
+                    # Without a break, hold text back for at most one more block
+                    if cut <= 0 and len(text) < 2 * self.STREAM_BLOCK_CHARS:
+                        carry = text
+                        continue
+                    if cut > 0:
+                        text, carry = text[:cut], text[cut:]
+                
+                if text.strip():
+                    yield Document(page_content=text, metadata={**base_metadata, "window": window})
+                    window += 1
+                
+                if not block:
+                    break
+    
+    def ingest_file_streaming(
+        self,
+        file_path: str,
+        category: str = "general",
+        shard_rows: int = 5000
+    ) -> int:
+        """Ingest a large file with bounded memory.
+        
+        The file is processed window by window (see _iter_file_windows) and
+        chunks are flushed to the stores every ``shard_rows`` chunks, so
+        memory stays flat regardless of file size. File types other than
+        .txt and .pdf go through ingest_file.
+        
+        Args:
+            file_path: Path to the file
+            category: Category tag for the document
+            shard_rows: Chunks buffered before each store flush
+            
+        Returns:
+            Number of chunks ingested
+        """
+        path = Path(file_path)
+        if path.suffix.lower() not in (".txt", ".pdf"):
+            return self.ingest_file(file_path, category)
+        
+        self._log("\n[FILE] Streaming: %s", path.name)
+        self._log("=" * 60)
+        
+        curatorial_dict = None
+        buffer = []
+        total_chunks = 0
+        
+        for doc in self._iter_file_windows(file_path):
+            doc.metadata["category"] = category
+            doc.metadata["title"] = doc.metadata.get("filename", path.stem)
+            
+            # Curate once, from the start of the file
+            if curatorial_dict is None:
+                curatorial_dict = self.curator.curate_document(
+                    file_path=file_path,
+                    content=doc.page_content[:1000]
+                ).to_dict()
+            doc.metadata.update(curatorial_dict)
+            
+            buffer.extend(self._enrich_metadata(self._chunk_documents([doc])))
+            
+            if len(buffer) >= shard_rows:
+                self._store_dual(buffer)
+                total_chunks += len(buffer)
+                buffer = []
+        
+        if buffer:
+            self._store_dual(buffer)
+            total_chunks += len(buffer)
+        
+        self._log("\n[DONE] %s: %d chunks stored", path.name, total_chunks)
+        self._log("=" * 60)
+        
+        return total_chunks
+    
+    def ingest_files(
+        self,
+        items: List[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+        force: bool = False
+    ) -> Dict[str, int]:
+        """Ingest several files, storing all their chunks together.
+        
+        Files load concurrently on a thread pool and are curated, chunked
+        and enriched in worker processes; the chunks of all files are then
+        embedded in shared batches and written to the knowledge store in one
+        transaction from this thread. A file that fails to load or process
+        is reported and left out.
+        
+        Files already in the ingested-files manifest with the same
+        modification time and size, or the same content hash, are skipped
+        without being loaded and report the chunk count recorded when they
+        were ingested. The
+        chunks of a previously ingested file that is stored again are
+        deleted first.
+        
+        Args:
+            items: (file_path, category) pairs
+            batch_size: Chunks embedded per vector store call
+                (defaults to CHROMA_BATCH_SIZE)
+            force: Re-ingest files even if they are unchanged
+            
+        Returns:
+            Number of chunks per file path
+        """
+        self._log("\n[FILES] Ingesting %d files", len(items))
+        self._log("=" * 60)
+        
+        previous = self.knowledge_store.get_ingested_files()
+        manifest = {} if force else previous
+        signatures = {}
+        unchanged = {}
+        pending = []
+        
+        for file_path, category in items:
+            key = os.path.abspath(file_path)
+            try:
+                stat = os.stat(file_path)
+                signatures[key] = (stat.st_mtime, stat.st_size)
+            except OSError:
+                pass  # Reported by the loader
+            entry = manifest.get(key)
+            # Without a chunk count the file never finished storing
+            if entry is not None and entry[3] is not None and key in signatures:
+                if entry[:2] == signatures[key]:
+                    unchanged[file_path] = entry[3]
+                    continue
+                if entry[2] is not None and self._content_unchanged(file_path, entry[2]):
+                    # Touched but identical content; only the signature is refreshed
+                    self.knowledge_store.mark_file_ingested(key, *signatures[key], sha=entry[2])
+                    unchanged[file_path] = entry[3]
+                    continue
+            pending.append((file_path, category))
+        
+        def load(item: Tuple[str, str]) -> Tuple[str, List[Document], str, Optional[Exception]]:
+            file_path, category = item
+            try:
+                return file_path, self._load_file(file_path, category), category, None
+            except Exception as e:
+                return file_path, [], category, e
+        
+        files = []
+        shas = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(len(pending), LOAD_MAX_WORKERS))) as executor:
+            for file_path, documents, category, error in executor.map(load, pending):
+                if error is not None:
+                    self._log("[ERROR] Failed to process %s: %s", file_path, error, level=logging.ERROR)
+                    continue
+                
+                key = os.path.abspath(file_path)
+                shas[key] = documents[0].metadata.get("file_sha") if documents else None
+                files.append((file_path, documents, category))
+        
+        if unchanged:
+            self._log("[SKIP] %d unchanged files", len(unchanged))
+        
+        prepared = {}
+        for file_path, chunks, error in self._prepare_files(files):
+            if error is not None:
+                self._log("[ERROR] Failed to process %s: %s", file_path, error, level=logging.ERROR)
+                continue
+            prepared[file_path] = chunks
+        
+        # Keep the input order regardless of which worker finished first
+        all_chunks = []
+        for file_path, _, _ in files:
+            if file_path in prepared:
+                all_chunks.extend(prepared[file_path])
+        
+        for file_path in prepared:
+            if os.path.abspath(file_path) in previous:
+                self._delete_file_chunks(file_path)
+        
+        if all_chunks:
+            self._store_dual(all_chunks, batch_size=batch_size)
+            self.knowledge_store.analyze()
+        
+        for file_path, chunks in prepared.items():
+            key = os.path.abspath(file_path)
+            self.knowledge_store.mark_file_ingested(
+                key, *signatures[key], sha=shas[key], chunk_count=len(chunks)
+            )
+        
+        self._log("\n[DONE] Files: %d chunks from %d files", len(all_chunks), len(prepared))
+        self._log("=" * 60)
+        
+        counts = {}
+        for file_path, _ in items:
+            if file_path in unchanged:
+                counts[file_path] = unchanged[file_path]
+            elif file_path in prepared:
+                counts[file_path] = len(prepared[file_path])
+        
+        return counts
+    
+    def _prepare_file(
+        self,
+        docs: List[Document],
+        file_path: str,
+        category: str
+    ) -> List[Document]:
+        """Run the CPU-bound stages for one file: curate, chunk and enrich.
+        
+        Args:
+            docs: Loaded documents of the file
+            file_path: Original file path
+            category: Category tag for the documents
+            
+        Returns:
+            Enriched chunks ready for storage
+        """
+        # Add category
+        for doc in docs:
+            doc.metadata["category"] = category
+        
+        # Curatorial gate
+        docs = self._apply_curatorial_gate(docs, file_path)
+        
+        # Chunk
+        chunks = self._chunk_documents(docs)
+        
+        # Enrich
+        return self._enrich_metadata(chunks)
+    
+    def _prepare_files(
+        self,
+        files_docs: Iterable[Tuple[str, List[Document], str]]
+    ) -> Iterator[Tuple[str, List[Document], Optional[Exception]]]:
+        """Prepare files in worker processes, yielding them as they finish.
+        
+        Work stays in-process unless INGEST_PROCESSES asks for more than one
+        worker: each spawned worker re-imports the ingestion stack, which
+        only pays off for large batches. A list of files never gets more
+        workers than it has files. At most two files per worker are in
+        flight, so a lazily loaded directory is never held in memory as a
+        whole.
+        
+        Args:
+            files_docs: (file_path, documents, category) triples
+            
+        Yields:
+            Tuples of (file_path, chunks, error); chunks is empty on error
+        """
+        workers = self.settings.INGEST_PROCESSES
+        if isinstance(files_docs, Sized):
+            workers = min(workers, len(files_docs))
+        
+        if workers <= 1:
+            for file_path, docs, category in files_docs:
+                try:
+                    yield file_path, self._prepare_file(docs, file_path, category), None
+                except Exception as e:
+                    yield file_path, [], e
+            return
+        
+        # Spawn, don't fork: loader threads (and the producer thread) are
+        # running, and a forked child could inherit their held locks
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_file_worker,
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            pending = set()
+            for file_path, docs, category in files_docs:
+                pending.add(executor.submit(_process_file, file_path, docs, category))
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            
+            for future in pending:
+                yield future.result()
+    
+    def _prepare_files_background(
+        self,
+        files_docs: Iterable[Tuple[str, List[Document], str]]
+    ) -> Iterator[Tuple[str, List[Document], Optional[Exception]]]:
+        """Run _prepare_files on a producer thread, yielding its results.
+        
+        Loading, chunking and enriching continue while the caller stores
+        the previous file. A bounded queue keeps the producer at most
+        PREPARED_QUEUE_SIZE files ahead.
+        
+        Args:
+            files_docs: (file_path, documents, category) triples
+            
+        Yields:
+            Tuples of (file_path, chunks, error), as from _prepare_files
+        """
+        results = queue.Queue(maxsize=self.PREPARED_QUEUE_SIZE)
+        done = object()
+        stop = threading.Event()
+        
+        def produce():
+            try:
+                for result in self._prepare_files(files_docs):
+                    results.put(result)
+                    if stop.is_set():
+                        break
+            except BaseException as e:
+                results.put(e)
+            finally:
+                results.put(done)
+        
+        producer = threading.Thread(target=produce, name="ingest-producer", daemon=True)
+        producer.start()
+        
+        try:
+            while True:
+                result = results.get()
+                if result is done:
+                    break
+                if isinstance(result, BaseException):
+                    raise result
+                yield result
+        finally:
+            # Unblock the producer if the consumer stops early
+            stop.set()
+            while producer.is_alive():
+                try:
+                    results.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+    
     def ingest_directory(
         self,
         directory_path: str,
         category: str = "general",
         recursive: bool = True,
-        extensions: Optional[List[str]] = None
+        extensions: Optional[List[str]] = None,
+        force: bool = False
     ) -> int:
         """Ingest all documents from a directory.
         
+        Files whose modification time and size match the ingested-files
+        manifest are skipped without being loaded. Files that changed only
+        on disk are hashed and, if the content hash still matches, skipped
+        without being parsed. Changed
+        files have their earlier chunks deleted before the new ones are
+        stored.
+        
         Args:
             directory_path: Path to directory
             category: Category tag for all documents
             recursive: Whether to search subdirectories
             extensions: File extensions to include
+            force: Re-ingest files even if they are unchanged
             
         Returns:
             Total number of chunks ingested
         """
-        self._log(f"\n[DIR] Scanning directory: {directory_path}")
-        self._log("="*60)
-        
-        # Load all documents
-        documents = load_directory(directory_path, recursive, extensions)
-        
-        if not documents:
-            self._log("[WARN] No documents found")
-            return 0
-        
-        # Group documents by file for curatorial processing
-        from collections import defaultdict
-        files_docs = defaultdict(list)
-        
-        for doc in documents:
-            file_path = doc.metadata.get("filepath", "unknown")
-            files_docs[file_path].append(doc)
+        self._log("\n[DIR] Scanning directory: %s", directory_path)
+        self._log("=" * 60)
+        
+        previous = self.knowledge_store.get_ingested_files()
+        manifest = {} if force else previous
+        signatures = {}
+        shas = {}
+        touched = []
+        skipped = 0
+        
+        def unchanged(file_path: Path) -> bool:
+            nonlocal skipped
+            key = os.path.abspath(file_path)
+            stat = file_path.stat()
+            signatures[key] = (stat.st_mtime, stat.st_size)
+            entry = manifest.get(key)
+            # Without a chunk count the file never finished storing
+            if entry is None or entry[3] is None:
+                return False
+            if entry[:2] == signatures[key]:
+                skipped += 1
+                return True
+            if entry[2] is not None and self._content_unchanged(file_path, entry[2]):
+                # Touched but identical content; only the signature is refreshed
+                shas[key] = entry[2]
+                touched.append(key)
+                skipped += 1
+                return True
+            return False
+        
+        def changed_files() -> Iterator[Tuple[str, List[Document], str]]:
+            # Files stream in one at a time; only a bounded window is in memory
+            for file_path, docs in load_directory_iter(directory_path, recursive, extensions, skip=unchanged):
+                if not docs:
+                    continue
+                
+                shas[os.path.abspath(file_path)] = docs[0].metadata.get("file_sha")
+                yield file_path, docs, category
         
         total_chunks = 0
-        
-        # Process each file
-        for file_path, docs in files_docs.items():
+        found_documents = False
+        
+        # Curate, chunk and enrich files in parallel on a producer thread;
+        # store on this thread only, so Chroma and SQLite never see
+        # concurrent writers
+        for file_path, chunks, error in self._prepare_files_background(changed_files()):
+            found_documents = True
+            if error is not None:
+                self._log("[ERROR] Failed to process %s: %s", file_path, error, level=logging.ERROR)
+                continue
+            
             try:
-                # Add category
-                for doc in docs:
-                    doc.metadata["category"] = category
-                
-                # Curatorial gate
-                docs = self._apply_curatorial_gate(docs, file_path)
-                
-                # Chunk
-                chunks = self._chunk_documents(docs)
-                
-                # Enrich
-                chunks = self._enrich_metadata(chunks)
+                key = os.path.abspath(file_path)
+                if key in previous:
+                    self._delete_file_chunks(file_path)
                 
                 # Store
                 self._store_dual(chunks)
                 
                 total_chunks += len(chunks)
                 
+                self.knowledge_store.mark_file_ingested(
+                    key, *signatures[key], sha=shas[key], chunk_count=len(chunks)
+                )
+                
             except Exception as e:
-                self._log(f"[ERROR] Failed to process {file_path}: {e}")
+                self._log("[ERROR] Failed to process %s: %s", file_path, e, level=logging.ERROR)
         
-        self._log(f"\n[DONE] Directory: {total_chunks} total chunks")
-        self._log("="*60)
+        for key in touched:
+            self.knowledge_store.mark_file_ingested(key, *signatures[key], sha=shas[key])
+        
+        if skipped:
+            self._log("[SKIP] %d unchanged files", skipped)
+        
+        if not found_documents:
+            if not skipped:
+                self._log("[WARN] No documents found", level=logging.WARNING)
+            return 0
+        
+        if total_chunks:
+            self.knowledge_store.analyze()
+        
+        self._log("\n[DONE] Directory: %d total chunks", total_chunks)
+        self._log("=" * 60)
         
         return total_chunks
     
@@ -303,36 +804,82 @@ class IngestionPipeline:
         Returns:
             Number of chunks ingested
         """
-        self._log(f"\n[URL] Fetching: {url}")
-        self._log("="*60)
+        self._log("\n[URL] Fetching: %s", url)
+        self._log("=" * 60)
         
         documents = load_url(url)
+        self._apply_url_policy(documents, category)
         
-        # Add metadata
+        # Chunk, enrich, store
+        chunks = self._chunk_documents(documents)
+        chunks = self._enrich_metadata(chunks)
+        self._store_dual(chunks)
+        
+        self._log("\n[DONE] URL: %d chunks", len(chunks))
+        self._log("=" * 60)
+        
+        return len(chunks)
+    
+    def _apply_url_policy(self, documents: List[Document], category: str):
+        """Tag web documents with category, title and media provenance.
+        
+        Args:
+            documents: Documents loaded from URLs (tagged with "url")
+            category: Category tag for the content
+        """
         for doc in documents:
+            # Add metadata
             doc.metadata["category"] = category
-            doc.metadata["title"] = url
+            doc.metadata["title"] = doc.metadata.get("url")
+            
+            # Apply curatorial gate (URLs treated as media by default)
+            doc.metadata.update(self.URL_PROVENANCE)
+    
+    async def ingest_urls_async(self, urls: List[str], category: str = "web") -> int:
+        """Ingest many URLs, fetching them concurrently.
         
-        # Apply curatorial gate (URLs treated as media by default)
-        for doc in documents:
-            doc.metadata.update({
-                "source_type": "media",
-                "authority_level": "media",
-                "epistemic_origin": "media_discourse",
-                "language": "en",
-                "region": "global"
-            })
+        Network latency overlaps across URLs; the fetched pages then go
+        through the usual stages and are stored in one batch.
+        
+        Args:
+            urls: Web URLs to scrape
+            category: Category tag for the content
+            
+        Returns:
+            Number of chunks ingested
+        """
+        self._log("\n[URL] Fetching %d URLs...", len(urls))
+        self._log("=" * 60)
+        
+        documents = await load_urls_async(urls)
+        if not documents:
+            self._log("[WARN] No pages fetched", level=logging.WARNING)
+            return 0
+        
+        self._apply_url_policy(documents, category)
         
         # Chunk, enrich, store
         chunks = self._chunk_documents(documents)
         chunks = self._enrich_metadata(chunks)
         self._store_dual(chunks)
         
-        self._log(f"\n[DONE] URL: {len(chunks)} chunks")
-        self._log("="*60)
+        self._log("\n[DONE] URLs: %d pages, %d chunks", len(documents), len(chunks))
+        self._log("=" * 60)
         
         return len(chunks)
     
+    def ingest_urls(self, urls: List[str], category: str = "web") -> int:
+        """Ingest many URLs concurrently from synchronous code.
+        
+        Args:
+            urls: Web URLs to scrape
+            category: Category tag for the content
+            
+        Returns:
+            Number of chunks ingested
+        """
+        return asyncio.run(self.ingest_urls_async(urls, category))
+    
     def ingest_text(
         self,
         text: str,
@@ -349,10 +896,8 @@ class IngestionPipeline:
         Returns:
             Number of chunks ingested
         """
-        self._log(f"\n[TEXT] Processing: {title}")
-        self._log("="*60)
-        
-        from app.ingestion.chunker import chunk_text
+        self._log("\n[TEXT] Processing: %s", title)
+        self._log("=" * 60)
         
         # Basic chunking for raw text
         chunks = chunk_text(text, metadata={
@@ -367,8 +912,8 @@ class IngestionPipeline:
         chunks = self._enrich_metadata(chunks)
         self._store_dual(chunks)
         
-        self._log(f"\n[DONE] Text: {len(chunks)} chunks")
-        self._log("="*60)
+        self._log("\n[DONE] Text: %d chunks", len(chunks))
+        self._log("=" * 60)
         
         return len(chunks)
     
@@ -390,6 +935,30 @@ class IngestionPipeline:
         }
 
 
+# Pipeline of an ingest_directory worker process
+_worker_pipeline: Optional[IngestionPipeline] = None
+
+
+def _init_file_worker() -> None:
+    """Build the pipeline of a worker process."""
+    global _worker_pipeline
+    _worker_pipeline = IngestionPipeline(verbose=False)
+    # Files are already spread over processes; don't nest chunking pools
+    _worker_pipeline.discourse_chunker.parallel_min_docs = 0
+
+
+def _process_file(
+    file_path: str,
+    docs: List[Document],
+    category: str
+) -> Tuple[str, List[Document], Optional[Exception]]:
+    """Curate, chunk and enrich one file inside a worker process."""
+    try:
+        return file_path, _worker_pipeline._prepare_file(docs, file_path, category), None
+    except Exception as e:
+        return file_path, [], e
+
+
 def get_pipeline(verbose: bool = True) -> IngestionPipeline:
     """Factory function to get pipeline instance.
     
@@ -1,13 +1,14 @@
 """FastAPI main application for Cultural AI RAG system."""
 
 from pathlib import Path
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from contextlib import asynccontextmanager
 
 from app.config import get_settings
+from app.core.logging_setup import setup_logging
 from app.api.routes import router
 
 
@@ -20,6 +21,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown events."""
     # Startup
     settings = get_settings()
+    setup_logging()
     print(f"[START] Cultural AI RAG System starting...")
     print(f"   Ollama URL: {settings.OLLAMA_BASE_URL}")
     print(f"   LLM Model: {settings.LLM_MODEL}")
@@ -27,6 +29,10 @@ async def lifespan(app: FastAPI):
     print(f"   ChromaDB: {settings.CHROMA_PERSIST_DIR}")
     print(f"   Frontend: {FRONTEND_DIR}")
     
+    # Resolve the frontend entry point once instead of on every request
+    index_path = FRONTEND_DIR / "index.html"
+    app.state.index_path = index_path if index_path.exists() else None
+    
     yield
     
     # Shutdown
@@ -82,10 +88,10 @@ if FRONTEND_DIR.exists():
 
 # Serve frontend
 @app.get("/")
-async def serve_frontend():
+async def serve_frontend(request: Request):
     """Serve the frontend application."""
-    index_path = FRONTEND_DIR / "index.html"
-    if index_path.exists():
+    index_path = getattr(request.app.state, "index_path", None)
+    if index_path is not None:
         return FileResponse(index_path)
     return {
         "name": "Cultural AI RAG",
@@ -1,5 +1,6 @@
 """Prompt templates for Cultural AI RAG system."""
 
+from typing import Dict
 from langchain_core.prompts import PromptTemplate, ChatPromptTemplate
 
 
@@ -115,3 +116,21 @@ def get_analysis_prompt() -> PromptTemplate:
 def get_linguistic_prompt() -> PromptTemplate:
     """Get the linguistic analysis prompt template."""
     return LINGUISTIC_PROMPT
+
+
+# Renderers for the chains' hot path: plain str.format_map on the raw
+# template, skipping PromptTemplate's input validation on every call
+
+def render_qa(inputs: Dict[str, str]) -> str:
+    """Render the Q&A prompt from ``context`` and ``question``."""
+    return CULTURAL_QA_TEMPLATE.format_map(inputs)
+
+
+def render_analysis(inputs: Dict[str, str]) -> str:
+    """Render the analysis prompt from ``context`` and ``topic``."""
+    return ANALYSIS_TEMPLATE.format_map(inputs)
+
+
+def render_linguistic(inputs: Dict[str, str]) -> str:
+    """Render the linguistic analysis prompt from ``context`` and ``question``."""
+    return LINGUISTIC_TEMPLATE.format_map(inputs)
@@ -10,6 +10,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.ingestion.pipeline import get_pipeline
 from app.core.vectorstore import get_collection_stats
+from app.core.logging_setup import setup_logging
 
 
 def main():
@@ -31,6 +32,12 @@ def main():
         help="URL to ingest"
     )
     
+    parser.add_argument(
+        "--urls-file",
+        type=str,
+        help="File with one URL per line to ingest concurrently"
+    )
+    
     parser.add_argument(
         "--category",
         "-c",
@@ -47,6 +54,19 @@ def main():
         help="Recursively search directories (default: True)"
     )
     
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream a large single file with bounded memory"
+    )
+    
+    parser.add_argument(
+        "--force",
+        "-f",
+        action="store_true",
+        help="Re-ingest files in a directory even if they are unchanged"
+    )
+    
     parser.add_argument(
         "--stats",
         "-s",
@@ -56,6 +76,8 @@ def main():
     
     args = parser.parse_args()
     
+    setup_logging()
+    
     # Show stats if requested
     if args.stats:
         stats = get_collection_stats()
@@ -65,9 +87,9 @@ def main():
         return
     
     # Need either path or URL
-    if not args.path and not args.url:
+    if not args.path and not args.url and not args.urls_file:
         parser.print_help()
-        print("\n[WARN] Please provide either --path or --url")
+        print("\n[WARN] Please provide either --path, --url or --urls-file")
         return
     
     pipeline = get_pipeline(verbose=True)
@@ -78,6 +100,15 @@ def main():
         chunks = pipeline.ingest_url(args.url, category=args.category)
         print(f"\n[DONE] Ingested {chunks} chunks from URL")
     
+    # Ingest a list of URLs (blank lines and # comments are skipped)
+    if args.urls_file:
+        with open(args.urls_file, encoding="utf-8") as f:
+            urls = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        
+        print(f"\n[URL] Ingesting {len(urls)} URLs from: {args.urls_file}")
+        chunks = pipeline.ingest_urls(urls, category=args.category)
+        print(f"\n[DONE] Ingested {chunks} chunks from URLs")
+    
     # Ingest path (file or directory)
     if args.path:
         path = os.path.abspath(args.path)
@@ -88,14 +119,18 @@ def main():
         
         if os.path.isfile(path):
             print(f"\n[FILE] Ingesting file: {path}")
-            chunks = pipeline.ingest_file(path, category=args.category)
+            if args.stream:
+                chunks = pipeline.ingest_file_streaming(path, category=args.category)
+            else:
+                chunks = pipeline.ingest_file(path, category=args.category)
             print(f"\n[DONE] Ingested {chunks} chunks from file")
         else:
             print(f"\n[DIR] Ingesting directory: {path}")
             chunks = pipeline.ingest_directory(
                 path,
                 category=args.category,
-                recursive=args.recursive
+                recursive=args.recursive,
+                force=args.force
             )
             print(f"\n[DONE] Ingested {chunks} chunks from directory")
     
@@ -3,11 +3,14 @@
 
 import sys
 import os
+from collections import Counter
+from contextlib import closing
 from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.ingestion.pipeline import get_pipeline
+from app.core.logging_setup import setup_logging
 from app.core.cultural_retriever import get_cultural_retriever, RetrievalStrategy
 
 
@@ -31,21 +34,29 @@ def test_ingestion():
         ("knowledge_base/media/artikel-media-sosial.txt", "media"),
     ]
     
-    total_chunks = 0
-    
+    existing_files = []
     for file_path, category in test_files:
         if os.path.exists(file_path):
-            try:
-                chunks = pipeline.ingest_file(file_path, category=category)
-                total_chunks += chunks
-                print(f"✓ {Path(file_path).name}: {chunks} chunks")
-            except Exception as e:
-                print(f"✗ Error ingesting {file_path}: {e}")
+            existing_files.append((file_path, category))
         else:
             print(f"✗ File not found: {file_path}")
     
+    # One call: chunks of all files are embedded and stored in shared batches
+    counts = pipeline.ingest_files(existing_files)
+    
+    for file_path, _ in existing_files:
+        if file_path in counts:
+            print(f"✓ {Path(file_path).name}: {counts[file_path]} chunks")
+        else:
+            print(f"✗ Error ingesting {file_path}")
+    
+    total_chunks = sum(counts.values())
     print(f"\n📊 Total chunks ingested: {total_chunks}")
     
+    assert existing_files, "No sample documents found"
+    failed = [file_path for file_path, _ in existing_files if counts.get(file_path, 0) == 0]
+    assert not failed, f"No chunks ingested for: {failed}"
+    
     # Show statistics
     print_section("KNOWLEDGE BASE STATISTICS")
     stats = pipeline.get_stats()
@@ -66,9 +77,10 @@ def test_ingestion():
         print(f"    {authority}: {count}")
     
     print(f"\n  Total Themes: {stats['knowledge_store']['total_themes']}")
+    top_themes = list(stats['knowledge_store'].get('top_themes', {}).items())[:5]
+    print(f"  Top Themes: {top_themes}")
     print(f"  Total Relations: {stats['knowledge_store']['total_relations']}")
-    
-    return total_chunks > 0
+    assert stats['knowledge_store']['total_documents'] >= total_chunks
 
 
 def test_cultural_retrieval():
@@ -80,10 +92,22 @@ def test_cultural_retrieval():
     
     print(f"\n🔍 Test Query: \"{test_query}\"\n")
     
+    # Tests 1-5 share one similarity search
+    views = retriever.retrieve_all_views(
+        test_query,
+        k_standard=3,
+        k_epistemic=3,
+        source_type="community",
+        k_per_source=1,
+        k_authority=4,
+        boost_community=True,
+        k_balanced=4
+    )
+    
     # Test 1: Standard retrieval
     print("1️⃣  STANDARD SIMILARITY RETRIEVAL")
     print("-" * 70)
-    standard_docs = retriever.retrieve_standard(test_query, k=3)
+    standard_docs = views["standard"]
     for i, doc in enumerate(standard_docs, 1):
         meta = doc.metadata
         print(f"  [{i}] Source: {meta.get('source_type', 'N/A')} | "
@@ -97,11 +121,7 @@ def test_cultural_retrieval():
     # Test 2: Epistemic filtering (community only)
     print("\n2️⃣  EPISTEMIC FILTERING (Community Sources Only)")
     print("-" * 70)
-    community_docs = retriever.retrieve_epistemic(
-        test_query,
-        source_type="community",
-        k=3
-    )
+    community_docs = views["epistemic"]
     print(f"  Found {len(community_docs)} community documents")
     for i, doc in enumerate(community_docs, 1):
         meta = doc.metadata
@@ -112,7 +132,7 @@ def test_cultural_retrieval():
     # Test 3: Plural perspectives
     print("\n3️⃣  PLURAL RETRIEVAL (Multiple Perspectives)")
     print("-" * 70)
-    perspectives = retriever.retrieve_plural(test_query, k_per_source=1)
+    perspectives = views["plural"]
     for source_type, docs in perspectives.items():
         print(f"  📂 {source_type.upper()}: {len(docs)} document(s)")
         for doc in docs:
@@ -124,11 +144,7 @@ def test_cultural_retrieval():
     # Test 4: Authority-ranked (boost community)
     print("\n4️⃣  AUTHORITY-RANKED (Community Boosted)")
     print("-" * 70)
-    ranked_docs = retriever.retrieve_authority_ranked(
-        test_query,
-        boost_community=True,
-        k=4
-    )
+    ranked_docs = views["authority_ranked"]
     for i, doc in enumerate(ranked_docs, 1):
         meta = doc.metadata
         print(f"  [{i}] Authority: {meta.get('authority_level', 'N/A')} | "
@@ -138,11 +154,10 @@ def test_cultural_retrieval():
     # Test 5: Discourse balanced
     print("\n5️⃣  DISCOURSE-BALANCED RETRIEVAL")
     print("-" * 70)
-    balanced_docs = retriever.retrieve_discourse_balanced(test_query, k=4)
-    discourse_positions = {}
-    for doc in balanced_docs:
-        position = doc.metadata.get('discourse_position', 'unknown')
-        discourse_positions[position] = discourse_positions.get(position, 0) + 1
+    balanced_docs = views["discourse_balanced"]
+    discourse_positions = Counter(
+        doc.metadata.get('discourse_position', 'unknown') for doc in balanced_docs
+    )
     
     print(f"  Total documents: {len(balanced_docs)}")
     print(f"  Discourse distribution:")
@@ -180,31 +195,26 @@ def evaluate_discourse_detection():
     
     knowledge_store = get_knowledge_store()
     
-    # Get sample documents
-    import sqlite3
-    conn = knowledge_store._get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT title, chunk_role, discourse_position, themes
-        FROM documents
-        LIMIT 10
-    """)
+    # Get sample documents; themes live in document_themes, joined in the same query
+    with closing(knowledge_store._get_connection()) as conn:
+        rows = conn.execute("""
+            SELECT d.title, d.chunk_role, d.discourse_position,
+                   GROUP_CONCAT(t.name, ', ') AS themes
+            FROM (SELECT id, title, chunk_role, discourse_position FROM documents LIMIT ?) d
+            LEFT JOIN document_themes dt ON dt.doc_id = d.id
+            LEFT JOIN themes t ON t.id = dt.theme_id
+            GROUP BY d.id
+            ORDER BY d.id
+        """, (10,)).fetchall()
     
     print("\n📝 Sample Discourse Metadata:\n")
-    for row in cursor.fetchall():
-        title = row[0] if row[0] else "Untitled"
-        chunk_role = row[1]
-        discourse_position = row[2]
-        themes = row[3]
-        
-        print(f"  Document: {title[:40]}...")
-        print(f"    Chunk Role: {chunk_role}")
-        print(f"    Discourse Position: {discourse_position}")
-        print(f"    Themes: {themes}")
-        print()
-    
-    conn.close()
+    print("\n".join(
+        f"  Document: {(row['title'] or 'Untitled')[:40]}...\n"
+        f"    Chunk Role: {row['chunk_role']}\n"
+        f"    Discourse Position: {row['discourse_position']}\n"
+        f"    Themes: {row['themes']}\n"
+        for row in rows
+    ))
     
     print("\n✅ Discourse detection appears to be working!")
     print("   Check the metadata to verify accuracy.")
@@ -212,17 +222,15 @@ def evaluate_discourse_detection():
 
 def main():
     """Main test function."""
+    setup_logging()
+    
     print("\n" + "="*70)
     print("  CULTURAL NODES - COMPREHENSIVE TESTING")
     print("="*70)
     
     try:
         # Phase 1: Ingestion
-        success = test_ingestion()
-        
-        if not success:
-            print("\n⚠️  No documents were ingested. Please check file paths.")
-            return
+        test_ingestion()
         
         # Phase 2: Cultural retrieval
         test_cultural_retrieval()
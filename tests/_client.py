@@ -0,0 +1,25 @@
+"""Shared TestClient for the API tests."""
+
+from functools import lru_cache
+import atexit
+import os
+import sys
+
+from fastapi.testclient import TestClient
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+
+@lru_cache(maxsize=1)
+def get_client() -> TestClient:
+    """Build the TestClient once per process; app.main is imported lazily.
+    
+    The app's lifespan is entered here and held until interpreter exit, so
+    startup runs once for the whole session.
+    """
+    from app.main import app
+    client = TestClient(app)
+    client.__enter__()
+    atexit.register(client.__exit__, None, None, None)
+    return client
@@ -1,5 +1,4 @@
 # import pytest  <-- Removed
-from fastapi.testclient import TestClient
 from unittest.mock import MagicMock, patch
 import os
 import sys
@@ -7,10 +6,8 @@ import sys
 # Add project root to sys.path
 sys.path.append(os.getcwd())
 
-from app.main import app
 from app.core.knowledge_store import get_knowledge_store
-
-client = TestClient(app)
+from tests._client import get_client
 
 # Mock headers for different roles
 headers_contributor = {
@@ -24,6 +21,8 @@ headers_curator = {
 }
 
 def test_curation_flow():
+    client = get_client()
+    
     # 1. Submit Knowledge (as Contributor)
     print("\n[Test] Submitting Knowledge...")
     payload = {
@@ -84,10 +83,118 @@ def test_curation_flow():
 
     print("[Test] Flow Complete: Submit -> List -> Approve -> Verified")
 
+def test_batch_approval():
+    client = get_client()
+    
+    # 1. Submit several items (as Contributor)
+    print("\n[Test] Submitting a batch...")
+    submission_ids = []
+    for i in range(3):
+        payload = {
+            "title": f"Batch Submission {i}",
+            "source_type": "community",
+            "content": f"Batch test content {i}.",
+            "category": "test"
+        }
+        response = client.post("/api/curation/submit", json=payload, headers=headers_contributor)
+        assert response.status_code == 200
+        submission_ids.append(response.json()["id"])
+    
+    # 2. Approve all at once (as Curator); an unknown ID is skipped
+    print(f"[Test] Approving Submissions {submission_ids}...")
+    with patch("app.api.curation.process_ingestion_batch") as mock_ingest:
+        response = client.post(
+            "/api/curation/submissions/approve_batch",
+            json={"ids": submission_ids + [-1], "note": "Batch OK"},
+            headers=headers_curator
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["approved"] == submission_ids
+        assert data["skipped"] == [-1]
+        
+        # One background task for the whole batch
+        mock_ingest.assert_called_once()
+    
+    # 3. Verify Status Updated
+    store = get_knowledge_store()
+    for submission_id in submission_ids:
+        updated_sub = store.get_submission_by_id(submission_id)
+        assert updated_sub["status"] == "approved"
+        assert updated_sub["curator_note"] == "Batch OK"
+    
+    # 4. Approving again skips them and queues no ingestion
+    with patch("app.api.curation.process_ingestion_batch") as mock_ingest:
+        response = client.post(
+            "/api/curation/submissions/approve_batch",
+            json={"ids": submission_ids},
+            headers=headers_curator
+        )
+        assert response.json()["approved"] == []
+        assert response.json()["skipped"] == submission_ids
+        mock_ingest.assert_not_called()
+    
+    print("[Test] Batch Flow Complete: Submit x3 -> Approve Batch -> Verified")
+
+def test_batch_approval_skips_already_approved():
+    client = get_client()
+    store = get_knowledge_store()
+    
+    # One submission approved through the single endpoint, one still pending
+    submission_ids = []
+    for i in range(2):
+        payload = {
+            "title": f"Mixed Submission {i}",
+            "source_type": "community",
+            "content": f"Mixed test content {i}.",
+            "category": "test"
+        }
+        response = client.post("/api/curation/submit", json=payload, headers=headers_contributor)
+        submission_ids.append(response.json()["id"])
+    approved_id, pending_id = submission_ids
+    
+    with patch("app.api.curation.process_ingestion"):
+        response = client.post(
+            f"/api/curation/submissions/{approved_id}/approve",
+            json={"note": "First"},
+            headers=headers_curator
+        )
+        assert response.status_code == 200
+    
+    # The batch only approves and ingests the pending one
+    with patch("app.api.curation.process_ingestion_batch") as mock_ingest:
+        response = client.post(
+            "/api/curation/submissions/approve_batch",
+            json={"ids": submission_ids, "note": "Second"},
+            headers=headers_curator
+        )
+        assert response.status_code == 200
+        assert response.json()["approved"] == [pending_id]
+        assert response.json()["skipped"] == [approved_id]
+        
+        ingested = mock_ingest.call_args[0][0]
+        assert [s["id"] for s in ingested] == [pending_id]
+    
+    # The first approval is left untouched
+    assert store.get_submission_by_id(approved_id)["curator_note"] == "First"
+    
+    # The store never re-approves a processed submission
+    assert store.update_submissions_status(submission_ids, "approved", "other") == []
+    
+    # Single approval of an approved submission is rejected
+    response = client.post(
+        f"/api/curation/submissions/{approved_id}/approve",
+        json={},
+        headers=headers_curator
+    )
+    assert response.status_code == 400
+
 if __name__ == "__main__":
     # Manually run if executed directly
     try:
         test_curation_flow()
+        test_batch_approval()
+        test_batch_approval_skips_already_approved()
         print("\n✅ ALL TESTS PASSED")
     except AssertionError as e:
         print(f"\n❌ TEST FAILED: {e}")
@@ -0,0 +1,297 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+# Add project root to sys.path
+sys.path.append(os.getcwd())
+
+from app.core.embedding_cache import CachedEmbeddings, EmbeddingCache
+from app.core.knowledge_store import KnowledgeStore
+from app.core.metadata import MetadataEnricher, embedding_prefix, strip_embedding_prefix
+from app.ingestion.pipeline import IngestionPipeline
+
+SAMPLE_FILES = [
+    "knowledge_base/community/manifesto/teknologi-lokal.txt",
+    "knowledge_base/media/artikel-media-sosial.txt",
+]
+
+
+def _make_pipeline(workdir):
+    """Pipeline on a temporary knowledge store that records stored chunk counts."""
+    pipeline = IngestionPipeline(verbose=False)
+    pipeline.knowledge_store = KnowledgeStore(os.path.join(workdir, "knowledge.db"))
+    stored = []
+    pipeline._store_dual = lambda chunks, batch_size=None: stored.append(len(chunks))
+    pipeline._delete_file_chunks = lambda file_path: None
+    return pipeline, stored
+
+
+def _copy_samples(workdir):
+    files = []
+    for source in SAMPLE_FILES:
+        target = os.path.join(workdir, os.path.basename(source))
+        shutil.copy(source, target)
+        files.append(target)
+    return files
+
+
+def test_ingest_files_skips_unchanged():
+    with tempfile.TemporaryDirectory() as workdir:
+        pipeline, stored = _make_pipeline(workdir)
+        files = _copy_samples(workdir)
+        items = [(path, "community") for path in files]
+        
+        # 1. First run ingests every file
+        first = pipeline.ingest_files(items)
+        assert set(first) == set(files)
+        assert all(count > 0 for count in first.values())
+        assert stored == [sum(first.values())]
+        
+        # 2. Unchanged files are skipped but still report their chunk counts
+        assert pipeline.ingest_files(items) == first
+        assert len(stored) == 1
+        
+        # 3. A touched file with identical content is not even loaded
+        later = time.time() + 100
+        os.utime(files[0], (later, later))
+        with patch.object(pipeline, "_load_file", side_effect=AssertionError("loaded")):
+            assert pipeline.ingest_files(items) == first
+        assert len(stored) == 1
+        
+        # 4. Changed content is re-ingested on its own
+        with open(files[1], "a", encoding="utf-8") as f:
+            f.write("\n\nKritik baru tentang media sosial yang tidak adil.")
+        changed = pipeline.ingest_files(items)
+        assert stored[-1] == changed[files[1]]
+        assert changed[files[0]] == first[files[0]]
+        
+        # 5. force re-ingests everything
+        pipeline.ingest_files(items, force=True)
+        assert stored[-1] == sum(changed.values())
+
+
+def test_ingest_directory_skips_unchanged():
+    with tempfile.TemporaryDirectory() as workdir:
+        pipeline, stored = _make_pipeline(workdir)
+        _copy_samples(workdir)
+        
+        first = pipeline.ingest_directory(workdir)
+        assert first > 0
+        assert sum(stored) == first
+        
+        # Nothing changed, so nothing is stored again
+        stored.clear()
+        pipeline.ingest_directory(workdir)
+        assert stored == []
+        
+        # Touched files with identical content are hashed, not loaded
+        later = time.time() + 100
+        for name in os.listdir(workdir):
+            os.utime(os.path.join(workdir, name), (later, later))
+        with patch("app.ingestion.loaders._load_one", side_effect=AssertionError("loaded")):
+            pipeline.ingest_directory(workdir)
+        assert stored == []
+        
+        # A cleared manifest makes every file new again
+        pipeline.knowledge_store.clear_ingested_files()
+        assert pipeline.ingest_directory(workdir) == first
+        assert sum(stored) == first
+
+
+def test_ingest_files_worker_processes_match_serial():
+    with tempfile.TemporaryDirectory() as workdir:
+        pipeline, _ = _make_pipeline(workdir)
+        stored = []
+        pipeline._store_dual = lambda chunks, batch_size=None: stored.append(chunks)
+        items = [(path, "community") for path in _copy_samples(workdir)]
+        
+        results = []
+        for processes in (0, 2):
+            with patch.object(pipeline.settings, "INGEST_PROCESSES", processes):
+                counts = pipeline.ingest_files(items, force=True)
+            # Timestamps differ per run; everything else must match
+            chunks = [
+                (chunk.page_content, {
+                    key: value for key, value in chunk.metadata.items()
+                    if key not in ("ingested_at", "embedding_created_at")
+                })
+                for chunk in stored[-1]
+            ]
+            results.append((counts, chunks))
+        
+        assert results[1] == results[0]
+
+
+class _FakeVectorStore:
+    """In-memory stand-in for the Chroma helpers used by the pipeline."""
+    
+    def __init__(self):
+        self.chunks = {}
+    
+    def add_documents(self, documents):
+        ids = []
+        for doc in documents:
+            vector_id = f"vec_{len(self.chunks)}_{time.monotonic_ns()}"
+            self.chunks[vector_id] = doc
+            ids.append(vector_id)
+        return ids
+    
+    def delete_documents_by_source(self, sources):
+        ids = [i for i, doc in self.chunks.items() if doc.metadata["source"] in sources]
+        for vector_id in ids:
+            del self.chunks[vector_id]
+        return ids
+
+
+def test_reingest_modified_file_replaces_chunks():
+    with tempfile.TemporaryDirectory() as workdir:
+        pipeline = IngestionPipeline(verbose=False)
+        pipeline.knowledge_store = KnowledgeStore(os.path.join(workdir, "knowledge.db"))
+        files = _copy_samples(workdir)
+        items = [(path, "community") for path in files]
+        vectors = _FakeVectorStore()
+        
+        with patch("app.ingestion.pipeline.add_documents", vectors.add_documents), \
+                patch("app.ingestion.pipeline.delete_documents_by_source", vectors.delete_documents_by_source), \
+                patch("app.ingestion.pipeline.clear_qa_cache"):
+            first = pipeline.ingest_files(items)
+            assert len(vectors.chunks) == sum(first.values())
+            
+            # Rewrite one file; only its new chunks may remain
+            with open(files[1], "w", encoding="utf-8") as f:
+                f.write("Kritik baru tentang media sosial yang tidak adil.")
+            changed = pipeline.ingest_files(items)
+            assert changed[files[1]] < first[files[1]]
+            assert len(vectors.chunks) == sum(changed.values())
+            
+            new_texts = [doc.page_content for doc in vectors.chunks.values() if doc.metadata["source"] == files[1]]
+            assert len(new_texts) == changed[files[1]]
+            assert all("Kritik baru" in text for text in new_texts)
+            
+            # The knowledge store drops the stale rows too
+            assert pipeline.knowledge_store.get_stats()["total_documents"] == len(vectors.chunks)
+            
+            # Directory ingest replaces a modified file the same way
+            with open(files[0], "a", encoding="utf-8") as f:
+                f.write("\n\nParagraf tambahan tentang teknologi lokal.")
+            pipeline.ingest_directory(workdir)
+            assert pipeline.knowledge_store.get_stats()["total_documents"] == len(vectors.chunks)
+            counts = pipeline.knowledge_store.get_ingested_files()
+            assert len(vectors.chunks) == sum(entry[3] for entry in counts.values())
+
+
+def test_add_documents_bulk_rebuilds_indexes():
+    with tempfile.TemporaryDirectory() as workdir:
+        store = KnowledgeStore(os.path.join(workdir, "knowledge.db"))
+        rows = [
+            (f"vec_{i}", {
+                "title": f"Doc {i}",
+                "source_type": "community" if i % 2 else "academic",
+                "themes": ["identitas"] if i % 2 else ["teknologi"]
+            })
+            for i in range(store.BULK_INDEX_THRESHOLD * 2)
+        ]
+        
+        # Large first batch: indexes are dropped and rebuilt
+        doc_ids, failures = store.add_documents_bulk(rows)
+        assert len(doc_ids) == len(rows)
+        assert failures == []
+        
+        conn = store._get_connection()
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert set(store.DEFERRABLE_INDEXES) <= indexes
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        conn.close()
+        
+        # Already stored vector IDs keep their rows; new ones are added
+        first_ids = doc_ids
+        doc_ids, failures = store.add_documents_bulk(rows[:3] + [("vec_new", {"title": "New"})])
+        assert doc_ids[:3] == first_ids[:3]
+        assert doc_ids[3] not in first_ids
+        assert failures == []
+        assert store.get_stats()["total_documents"] == len(rows) + 1
+
+
+def test_enrich_batch_matches_enrich_metadata():
+    enricher = MetadataEnricher()
+    metadatas = [
+        {"title": "A", "source_type": "community"},
+        {"title": "B", "sensitivity": "low", "themes": ["identitas"]},
+        {},
+    ]
+    contents = [
+        "Upacara adat yang sakral dan rahasia, hanya untuk leluhur.",
+        "Upacara adat yang sakral dan rahasia.",
+        "",
+    ]
+    overrides = {"embedding_version": "v2"}
+    
+    batch = enricher.enrich_batch(metadatas, contents, overrides)
+    for metadata, content, result in zip(metadatas, contents, batch):
+        expected = enricher.enrich_metadata(metadata, content=content)
+        expected.update(overrides)
+        # Timestamps differ between calls; every other field must match
+        expected.pop("ingested_at")
+        assert result.pop("ingested_at")
+        assert result == expected
+
+
+class _CountingEmbeddings:
+    def __init__(self):
+        self.embedded = []
+    
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+    
+    def embed_query(self, text):
+        return [0.0, 0.0]
+
+
+def test_embedding_cache_hits_and_misses():
+    with tempfile.TemporaryDirectory() as workdir:
+        cache = EmbeddingCache(os.path.join(workdir, "cache.db"))
+        model = _CountingEmbeddings()
+        embeddings = CachedEmbeddings(model, cache, "model:1")
+        
+        # Misses are embedded once each, even when repeated in a batch
+        first = embeddings.embed_documents(["a", "bb", "a"])
+        assert first == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+        assert model.embedded == ["a", "bb"]
+        
+        # Hits come from the cache; only the new text is embedded
+        second = embeddings.embed_documents(["bb", "ccc", "a"])
+        assert second == [[2.0, 1.0], [3.0, 1.0], [1.0, 1.0]]
+        assert model.embedded == ["a", "bb", "ccc"]
+        
+        # Another model namespace does not share vectors
+        other = CachedEmbeddings(model, cache, "model:2")
+        other.embed_documents(["a"])
+        assert model.embedded == ["a", "bb", "ccc", "a"]
+
+
+def test_strip_embedding_prefix():
+    metadata = {"title": "Manifesto", "source_type": "community"}
+    prefix = embedding_prefix(metadata)
+    assert prefix == "[Manifesto|community] "
+    
+    assert strip_embedding_prefix(prefix + "Isi dokumen", metadata) == "Isi dokumen"
+    
+    # Content without the prefix, or with another document's, is unchanged
+    assert strip_embedding_prefix("Isi dokumen", metadata) == "Isi dokumen"
+    assert strip_embedding_prefix("[Other|media] Isi", metadata) == "[Other|media] Isi"
+
+
+if __name__ == "__main__":
+    test_ingest_files_skips_unchanged()
+    test_ingest_directory_skips_unchanged()
+    test_ingest_files_worker_processes_match_serial()
+    test_reingest_modified_file_replaces_chunks()
+    test_add_documents_bulk_rebuilds_indexes()
+    test_enrich_batch_matches_enrich_metadata()
+    test_embedding_cache_hits_and_misses()
+    test_strip_embedding_prefix()
+    print("\n✅ ALL TESTS PASSED")
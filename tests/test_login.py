@@ -1,15 +1,13 @@
-from fastapi.testclient import TestClient
 import sys
 import os
 
 # Add project root to sys.path
 sys.path.append(os.getcwd())
 
-from app.main import app
-
-client = TestClient(app)
+from tests._client import get_client
 
 def test_login():
+    client = get_client()
     print("\n[Test] Testing Login Endpoint...")
     
     # 1. Valid Login